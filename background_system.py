@@ -1,97 +1,73 @@
 import random
-import pygame
-from constants import WIDTH, HEIGHT, GROUND_Y, BLOCK_SIZE, get_color
+from constants import GROUND_Y, BLOCK_SIZE
 from constants import CLOUD_PATTERNS, MOUNTAIN_PATTERNS
-from utils import draw_pixel_art
+from parallax import ParallaxLayer
 
+CLOUD_MIN_Y = 50
+CLOUD_MAX_Y = 150
+CLOUD_HEIGHT = max(len(pattern) for pattern in CLOUD_PATTERNS) * BLOCK_SIZE
+MOUNTAIN_HEIGHT = max(len(pattern) for pattern in MOUNTAIN_PATTERNS) * BLOCK_SIZE
 
-class BackgroundElement:
-    def __init__(self, x, y, speed, pattern):
-        self.x = x
-        self.y = y
-        self.speed = speed
-        self.pattern = pattern
+# Roughly the spacing the old one-object-per-element spawner produced
+MIN_GAP = 300
+MAX_GAP = 600
 
-    def update(self):
-        self.x -= self.speed
-
-    def is_off_screen(self):
-        return self.x + len(self.pattern[0]) * BLOCK_SIZE < 0
 
-    def draw(self, win, color):
-        draw_pixel_art(win, self.pattern, self.x, self.y, color)
+class BackgroundManager:
+    def __init__(self, rng=random):
+        self.rng = rng
+        self.mountains = ParallaxLayer(
+            MOUNTAIN_PATTERNS, "MEDIUM_GRAY", 0.5, GROUND_Y - MOUNTAIN_HEIGHT, MOUNTAIN_HEIGHT
+        )
+        self.clouds = ParallaxLayer(
+            CLOUD_PATTERNS, "LIGHT_GRAY", 1.0, CLOUD_MIN_Y, CLOUD_MAX_Y - CLOUD_MIN_Y + CLOUD_HEIGHT
+        )
+        
+        self.create_layout()
 
+    def create_layout(self):
+        self.mountains.reset(self.create_placements(
+            self.mountains,
+            lambda pattern: GROUND_Y - len(pattern) * BLOCK_SIZE
+        ))
+        self.clouds.reset(self.create_placements(
+            self.clouds,
+            lambda pattern: self.rng.randint(CLOUD_MIN_Y, CLOUD_MAX_Y)
+        ))
 
-class Cloud(BackgroundElement):
-    def __init__(self):
-        pattern = random.choice(CLOUD_PATTERNS)
-        x = WIDTH + random.randint(0, 200)
-        y = random.randint(50, 150)
-        speed = random.uniform(0.5, 1.5)
-        super().__init__(x, y, speed, pattern)
+    def create_placements(self, layer, get_y):
+        # Stops a full gap short of the tile end so the wrap-around seam is spaced like the rest
+        placements = []
+        patterns = layer.patterns
+        x = self.rng.randint(0, MIN_GAP)
+        while x <= layer.tile_width - MIN_GAP:
+            pattern_id = self.rng.randrange(len(patterns))
+            placements.append((pattern_id, x, get_y(patterns[pattern_id])))
+            x += self.rng.randint(MIN_GAP, MAX_GAP)
+        return placements
 
+    def update(self):
+        self.mountains.update()
+        self.clouds.update()
 
-class Mountain(BackgroundElement):
-    def __init__(self):
-        pattern = random.choice(MOUNTAIN_PATTERNS)
-        x = WIDTH + random.randint(0, 100)
-        y = GROUND_Y - len(pattern) * BLOCK_SIZE
-        speed = random.uniform(0.2, 0.8)
-        super().__init__(x, y, speed, pattern)
+    def draw(self, win, alpha=1.0):
+        self.mountains.draw(win, alpha)
+        self.clouds.draw(win, alpha)
 
+    def get_state(self):
+        return (self.mountains.get_state(), self.clouds.get_state())
 
-class BackgroundManager:
-    def __init__(self):
-        self.clouds = []
-        self.mountains = []
-        self.cloud_spawn_timer = 0
-        self.mountain_spawn_timer = 0
-        
-        self.spawn_initial_elements()
+    def set_state(self, state):
+        mountains, clouds = state
+        self.mountains.set_state(mountains)
+        self.clouds.set_state(clouds)
 
-    def spawn_initial_elements(self):
-        for i in range(3):
-            cloud = Cloud()
-            cloud.x = random.randint(-200, WIDTH)
-            self.clouds.append(cloud)
-        
-        for i in range(2):
-            mountain = Mountain()
-            mountain.x = random.randint(-300, WIDTH)
-            self.mountains.append(mountain)
-
-    def update(self):
-        self.cloud_spawn_timer += 1
-        self.mountain_spawn_timer += 1
-        
-        if self.cloud_spawn_timer >= random.randint(300, 600):
-            self.clouds.append(Cloud())
-            self.cloud_spawn_timer = 0
-        
-        if self.mountain_spawn_timer >= random.randint(600, 1200):
-            self.mountains.append(Mountain())
-            self.mountain_spawn_timer = 0
-        
-        for cloud in self.clouds[:]:
-            cloud.update()
-            if cloud.is_off_screen():
-                self.clouds.remove(cloud)
-                
-        for mountain in self.mountains[:]:
-            mountain.update()
-            if mountain.is_off_screen():
-                self.mountains.remove(mountain)
-
-    def draw(self, win):
-        for mountain in self.mountains:
-            mountain.draw(win, get_color("MEDIUM_GRAY"))
-        
-        for cloud in self.clouds:
-            cloud.draw(win, get_color("LIGHT_GRAY"))
+    def get_draw_rects(self, alpha=1.0):
+        rects = self.mountains.get_draw_rects(alpha)
+        rects.extend(self.clouds.get_draw_rects(alpha))
+        return rects
 
-    def reset(self):
-        self.clouds.clear()
-        self.mountains.clear()
-        self.cloud_spawn_timer = 0
-        self.mountain_spawn_timer = 0
-        self.spawn_initial_elements()
\ No newline at end of file
+    def reset(self, rng=None):
+        if rng is not None:
+            self.rng = rng
+        self.create_layout()
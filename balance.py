@@ -0,0 +1,221 @@
+import argparse
+import json
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from constants import TICK_RATE, UPGRADE_NAMES, BALANCE_CACHE_FILE
+from batch_runner import DEFAULT_MAX_TICKS, submit_batch
+from stats import percentile
+from bots import BOTS
+from shop import create_shop_items
+from simulation import RULES_VERSION
+
+
+def get_loadout_key(bot_name, max_ticks, upgrades):
+    levels = ",".join(f"{name}={upgrades[name]}" for name in UPGRADE_NAMES)
+    return f"rules{RULES_VERSION}|{bot_name}|{max_ticks}|{levels}"
+
+
+class LoadoutCache:
+    # Run outcomes only depend on the loadout, not on shop prices or unlock scores,
+    # so the cache stays valid while Shop items are being tuned
+    def __init__(self, bot_name, runs, max_ticks, executor, path=BALANCE_CACHE_FILE):
+        self.bot_name = bot_name
+        self.runs = runs
+        self.max_ticks = max_ticks
+        self.executor = executor
+        self.path = path
+        self.samples = {}
+        self.simulated_runs = 0
+        self.load()
+
+    def load(self):
+        if self.path and os.path.exists(self.path):
+            try:
+                with open(self.path, 'r') as f:
+                    self.samples = json.load(f)
+            except Exception as e:
+                print(f"Error loading balance cache: {e}")
+
+    def save(self):
+        if not self.path:
+            return
+        try:
+            with open(self.path, 'w') as f:
+                json.dump(self.samples, f, separators=(",", ":"))
+        except Exception as e:
+            print(f"Error saving balance cache: {e}")
+
+    def get_key(self, upgrades):
+        return get_loadout_key(self.bot_name, self.max_ticks, upgrades)
+
+    def get(self, upgrades):
+        return self.samples[self.get_key(upgrades)]
+
+    def prefetch(self, loadouts):
+        # Every loadout missing from the cache is simulated in one parallel wave
+        pending = {}
+        for upgrades in loadouts:
+            key = self.get_key(upgrades)
+            if len(self.samples.get(key, ())) < self.runs and key not in pending:
+                pending[key] = submit_batch(self.executor, self.bot_name, upgrades, self.runs, 0, self.max_ticks)
+
+        for key, futures in pending.items():
+            samples = []
+            for future in futures:
+                samples.extend([r["score"], r["ticks"], r["coins"]] for r in future.result())
+            self.samples[key] = samples
+            self.simulated_runs += len(samples)
+
+        if pending:
+            self.save()
+
+
+def get_purchase_loadouts(progression):
+    upgrades = {name: 0 for name in UPGRADE_NAMES}
+    loadouts = []
+    for name, level, runs, ticks, cost in progression.purchases:
+        upgrades[name] = level
+        loadouts.append(dict(upgrades))
+    return loadouts
+
+
+class Progression:
+    # One simulated player: plays runs sampled from its loadout, then buys the cheapest available upgrade
+    def __init__(self, items, seed):
+        self.items = items
+        self.rng = random.Random(seed)
+        self.upgrades = {name: 0 for name in UPGRADE_NAMES}
+        self.coins = 0
+        self.high_score = 0
+        self.runs = 0
+        self.ticks = 0
+        self.purchases = []
+        self.unlocked_at = {}
+
+    def is_finished(self):
+        return all(item.is_maxed(self.upgrades[name]) for name, item in self.items.items())
+
+    def play_run(self, samples):
+        score, ticks, coins = self.rng.choice(samples)
+        self.runs += 1
+        self.ticks += ticks
+        self.coins += coins
+        self.high_score = max(self.high_score, score)
+
+        for name, item in self.items.items():
+            if name not in self.unlocked_at and item.is_level_unlocked(0, self.high_score):
+                self.unlocked_at[name] = (self.runs, self.ticks)
+
+        while self.buy_cheapest():
+            pass
+
+    def buy_cheapest(self):
+        best = None
+        for name, item in self.items.items():
+            level = self.upgrades[name]
+            if item.is_maxed(level) or not item.is_next_level_unlocked(level, self.high_score):
+                continue
+            cost = item.get_cost(level)
+            if cost <= self.coins and (best is None or cost < best[1]):
+                best = (name, cost)
+
+        if best is None:
+            return False
+
+        name, cost = best
+        self.coins -= cost
+        self.upgrades[name] += 1
+        self.purchases.append((name, self.upgrades[name], self.runs, self.ticks, cost))
+        return True
+
+
+def format_hours(ticks):
+    return f"{ticks / TICK_RATE / 3600:.1f}h"
+
+
+def print_progression(progression, cache):
+    print(f"{'#':>3} {'upgrade':<18} {'lvl':>3} {'cost':>8} {'run':>7} {'played':>8} "
+          f"{'coins/run':>10} {'p50 score':>12}")
+
+    loadouts = get_purchase_loadouts(progression)
+    for index, (name, level, runs, ticks, cost) in enumerate(progression.purchases, 1):
+        samples = cache.get(loadouts[index - 1])
+        coins_per_run = sum(sample[2] for sample in samples) / len(samples)
+        median_score = percentile(sorted(sample[0] for sample in samples), 50)
+        print(f"{index:>3} {name:<18} {level:>3} {cost:>8,} {runs:>7,} {format_hours(ticks):>8} "
+              f"{coins_per_run:>10,.1f} {median_score:>12,}")
+
+
+def print_time_to_unlock(items, progressions):
+    print(f"{'upgrade':<18} {'unlocked':>9} {'p50 run':>9} {'p50 time':>9} "
+          f"{'maxed':>7} {'p50 run':>9} {'p50 time':>9}")
+
+    for name, item in items.items():
+        unlocked = sorted(p.unlocked_at[name] for p in progressions if name in p.unlocked_at)
+        maxed = sorted(
+            (runs, ticks) for p in progressions
+            for upgrade, level, runs, ticks, cost in p.purchases
+            if upgrade == name and level == item.max_level
+        )
+
+        line = f"{name:<18} {len(unlocked):>4}/{len(progressions):<4}"
+        if unlocked:
+            runs, ticks = percentile(unlocked, 50)
+            line += f" {runs:>9,} {format_hours(ticks):>9}"
+        else:
+            line += f" {'never':>9} {'':>9}"
+
+        line += f" {len(maxed):>3}/{len(progressions):<3}"
+        if maxed:
+            runs, ticks = percentile(maxed, 50)
+            line += f" {runs:>9,} {format_hours(ticks):>9}"
+        else:
+            line += f" {'never':>9}"
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Estimate the Rogue Dino shop progression from simulated runs")
+    parser.add_argument("--bot", choices=sorted(BOTS), default="casual")
+    parser.add_argument("--runs", type=int, default=200, help="simulated runs per loadout")
+    parser.add_argument("--players", type=int, default=20, help="simulated players walking the shop")
+    parser.add_argument("--max-runs", type=int, default=5000, help="runs each player plays at most")
+    parser.add_argument("--max-ticks", type=int, default=DEFAULT_MAX_TICKS)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--cache", default=BALANCE_CACHE_FILE, help="per-loadout result cache, '' to disable")
+    args = parser.parse_args()
+
+    items = create_shop_items()
+    progressions = [Progression(items, seed) for seed in range(args.players)]
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        cache = LoadoutCache(args.bot, args.runs, args.max_ticks, executor, args.cache)
+
+        active = progressions
+        while active:
+            cache.prefetch(p.upgrades for p in active)
+            for progression in active:
+                progression.play_run(cache.get(progression.upgrades))
+            active = [p for p in active if not p.is_finished() and p.runs < args.max_runs]
+
+        # The player whose progression finished in the middle of the pack
+        median_player = sorted(progressions, key=lambda p: (len(p.purchases), -p.ticks))[len(progressions) // 2]
+        # Its final loadout may never have been played, but the curve reports it too
+        cache.prefetch(get_purchase_loadouts(median_player))
+
+    elapsed = time.perf_counter() - start
+    print(f"{len(cache.samples)} loadouts cached, {cache.simulated_runs:,} runs simulated in {elapsed:.1f}s\n")
+
+    print(f"Progression curve (player {progressions.index(median_player)}, "
+          f"{median_player.runs:,} runs, {format_hours(median_player.ticks)} played)")
+    print_progression(median_player, cache)
+
+    print(f"\nTime to unlock over {len(progressions)} players")
+    print_time_to_unlock(items, progressions)
+
+
+if __name__ == "__main__":
+    main()
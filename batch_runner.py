@@ -0,0 +1,136 @@
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from constants import TICK_RATE, UPGRADE_NAMES
+from bots import BOTS, create_bot
+from simulation import Simulation
+from stats import percentile
+
+PERCENTILES = [5, 25, 50, 75, 95, 99]
+# Half an hour of play; a perfect bot would otherwise never finish
+DEFAULT_MAX_TICKS = TICK_RATE * 60 * 30
+RUNS_PER_TASK = 50
+
+
+def run_game(bot_name, upgrades, seed, max_ticks=DEFAULT_MAX_TICKS):
+    simulation = Simulation(dict(upgrades), seed)
+    bot = create_bot(bot_name, seed)
+
+    while simulation.tick < max_ticks:
+        if simulation.step(bot.act(simulation)):
+            break
+
+    return {
+        "seed": seed,
+        "score": simulation.score,
+        "ticks": simulation.tick,
+        "coins": simulation.coins_this_run,
+        "cause_of_death": simulation.cause_of_death or "timeout"
+    }
+
+
+def run_games(bot_name, upgrades, seeds, max_ticks=DEFAULT_MAX_TICKS):
+    return [run_game(bot_name, upgrades, seed, max_ticks) for seed in seeds]
+
+
+def submit_batch(executor, bot_name, upgrades, runs, base_seed=0, max_ticks=DEFAULT_MAX_TICKS):
+    # Runs are sent out in chunks to keep IPC overhead low
+    seeds = range(base_seed, base_seed + runs)
+    return [
+        executor.submit(run_games, bot_name, upgrades, seeds[i:i + RUNS_PER_TASK], max_ticks)
+        for i in range(0, runs, RUNS_PER_TASK)
+    ]
+
+
+def run_batch(bot_name, upgrades, runs, base_seed=0, workers=None, max_ticks=DEFAULT_MAX_TICKS):
+    # Yields results as workers finish them
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = submit_batch(executor, bot_name, upgrades, runs, base_seed, max_ticks)
+        for future in as_completed(futures):
+            yield from future.result()
+
+
+def summarize(results):
+    summary = {}
+    for metric in ("score", "ticks", "coins"):
+        values = sorted(result[metric] for result in results)
+        summary[metric] = {
+            "mean": sum(values) / len(values) if values else 0,
+            "percentiles": {p: percentile(values, p) for p in PERCENTILES}
+        }
+
+    causes = {}
+    for result in results:
+        causes[result["cause_of_death"]] = causes.get(result["cause_of_death"], 0) + 1
+    summary["causes"] = causes
+    return summary
+
+
+def print_summary(summary, runs):
+    header = f"{'metric':>8} {'mean':>12}" + "".join(f"{'p' + str(p):>12}" for p in PERCENTILES)
+    print(header)
+    for metric in ("score", "ticks", "coins"):
+        row = summary[metric]
+        line = f"{metric:>8} {row['mean']:>12,.0f}"
+        line += "".join(f"{row['percentiles'][p]:>12,}" for p in PERCENTILES)
+        print(line)
+
+    causes = ", ".join(
+        f"{cause} {count / runs:.1%}" for cause, count in sorted(summary["causes"].items())
+    )
+    print(f"Cause of death: {causes}")
+
+
+def load_loadout(path):
+    # Accepts a save file or a bare upgrades dict
+    with open(path, 'r') as f:
+        data = json.load(f)
+    return data.get("upgrades", data)
+
+
+def parse_loadout(args):
+    upgrades = {name: 0 for name in UPGRADE_NAMES}
+    if args.loadout:
+        upgrades.update(load_loadout(args.loadout))
+    for setting in args.set:
+        name, level = setting.split("=")
+        if name not in upgrades:
+            raise SystemExit(f"Unknown upgrade: {name}")
+        upgrades[name] = int(level)
+    return upgrades
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run seeded headless Rogue Dino games across all cores")
+    parser.add_argument("--runs", type=int, default=1000)
+    parser.add_argument("--bot", choices=sorted(BOTS), default="casual")
+    parser.add_argument("--loadout", help="save file or upgrades JSON to play with")
+    parser.add_argument("--set", action="append", default=[], metavar="UPGRADE=LEVEL",
+                        help="override one upgrade level, may be repeated")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first run")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--max-ticks", type=int, default=DEFAULT_MAX_TICKS)
+    parser.add_argument("--progress", type=int, default=1000, help="print a summary every N runs")
+    args = parser.parse_args()
+
+    upgrades = parse_loadout(args)
+    print(f"{args.runs} runs of '{args.bot}' on {args.workers} workers")
+
+    results = []
+    start = time.perf_counter()
+    for result in run_batch(args.bot, upgrades, args.runs, args.seed, args.workers, args.max_ticks):
+        results.append(result)
+        if len(results) % args.progress == 0 and len(results) < args.runs:
+            print(f"\n{len(results)}/{args.runs} runs, {time.perf_counter() - start:.1f}s")
+            print_summary(summarize(results), len(results))
+
+    elapsed = time.perf_counter() - start
+    ticks = sum(result["ticks"] for result in results)
+    print(f"\n{len(results)} runs in {elapsed:.1f}s ({ticks / elapsed:,.0f} ticks/s)")
+    print_summary(summarize(results), len(results))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,352 @@
+import argparse
+import os
+import random
+import time
+
+
+def time_frames(frames, func):
+    start = time.perf_counter()
+    for i in range(frames):
+        func()
+    return (time.perf_counter() - start) * 1000 / frames
+
+
+def bench_scaling(args):
+    import pygame
+    from settings_system import SettingsSystem
+    from color_manager import ColorManager
+    from display_system import DisplaySystem
+    from constants import set_color_manager
+
+    pygame.init()
+    settings_system = SettingsSystem()
+    settings_system.data["fullscreen"] = False
+    color_manager = ColorManager(settings_system)
+    set_color_manager(color_manager)
+    display_system = DisplaySystem(settings_system, color_manager)
+
+    rng = random.Random(1)
+    # Roughly what a gameplay frame reports: player, a few obstacles, clouds, mountains, HUD text
+    gameplay_rects = [
+        pygame.Rect(rng.randint(0, 700), rng.randint(0, 330), rng.randint(16, 64), rng.randint(8, 48))
+        for i in range(12)
+    ]
+
+    print(f"{'scale':>6} {'size':>10} {'mode':>11} {'legacy ms':>10} {'full ms':>8} {'dirty ms':>9}")
+    for scale in settings_system.resolution_options:
+        settings_system.data["resolution_scale"] = scale
+        display_system.update_display()
+        screen = display_system.screen
+        virtual_screen = display_system.get_virtual_screen()
+        virtual_screen.fill((200, 200, 200))
+
+        def legacy_present():
+            if display_system.display_rect.size != virtual_screen.get_size():
+                scaled_surface = pygame.transform.scale(virtual_screen, display_system.display_rect.size)
+                screen.blit(scaled_surface, display_system.display_rect)
+            else:
+                screen.blit(virtual_screen, display_system.display_rect)
+            pygame.display.flip()
+
+        def full_present():
+            display_system.invalidate()
+            display_system.present()
+
+        def dirty_present():
+            for rect in gameplay_rects:
+                display_system.mark_dirty(rect)
+            display_system.present()
+
+        settings_system.data["dirty_rects"] = True
+        legacy = time_frames(args.frames, legacy_present)
+        full = time_frames(args.frames, full_present)
+        display_system.present()
+        dirty = time_frames(args.frames, dirty_present)
+
+        size = f"{display_system.display_rect.width}x{display_system.display_rect.height}"
+        print(f"{scale:>6} {size:>10} {display_system.scale_mode:>11} {legacy:>10.3f} {full:>8.3f} {dirty:>9.3f}")
+
+    pygame.quit()
+
+
+def bench_simulation(args):
+    from constants import INPUT_JUMP, UPGRADE_NAMES
+    from simulation import Simulation
+
+    upgrades = {name: 0 for name in UPGRADE_NAMES}
+    simulation = Simulation(upgrades)
+    ticks = args.frames * 1000
+    runs = 1
+
+    start = time.perf_counter()
+    for tick in range(ticks):
+        # Hop every 40 ticks so runs last long enough to exercise spawning and collisions
+        if simulation.step(INPUT_JUMP if tick % 40 == 0 else 0):
+            simulation.reset(runs)
+            runs += 1
+    elapsed = time.perf_counter() - start
+
+    print(f"{ticks} ticks over {runs} runs in {elapsed:.2f}s")
+    print(f"{ticks / elapsed:,.0f} ticks/s ({ticks / elapsed * 60 / 1e6:.2f}M ticks/min)")
+
+
+def bench_vector(args):
+    import numpy as np
+    from constants import INPUT_JUMP, UPGRADE_NAMES
+    from simulation import Simulation
+    from vector_sim import VectorSimulation
+
+    upgrades = {name: 0 for name in UPGRADE_NAMES}
+    steps = args.frames * 100
+
+    simulation = Simulation(upgrades)
+    start = time.perf_counter()
+    for tick in range(steps):
+        if simulation.step(INPUT_JUMP if tick % 40 == 0 else 0):
+            simulation.reset(tick)
+    scalar_rate = steps / (time.perf_counter() - start)
+
+    print(f"{'envs':>6} {'env-steps/s':>14} {'vs Simulation':>14}")
+    print(f"{'1':>6} {scalar_rate:>14,.0f} {'1.0x':>14}")
+
+    for num_envs in args.envs:
+        vector = VectorSimulation(num_envs, upgrades, seed=1)
+        ticks = max(1, steps // num_envs)
+        idle = np.zeros(num_envs, dtype=np.int32)
+        hop = np.full(num_envs, INPUT_JUMP, dtype=np.int32)
+
+        start = time.perf_counter()
+        for tick in range(ticks):
+            # Same hop-every-40-ticks policy, staggered so envs don't all jump at once
+            vector.step(np.where((vector.tick + vector.env_indices) % 40 == 0, hop, idle))
+        rate = ticks * num_envs / (time.perf_counter() - start)
+        print(f"{num_envs:>6} {rate:>14,.0f} {rate / scalar_rate:>13.1f}x")
+
+
+def bench_allocations(args):
+    import pygame
+    import tracemalloc
+    from constants import INPUT_JUMP, UPGRADE_NAMES
+    from simulation import Simulation
+
+    original_rect = pygame.Rect
+    rects_created = [0]
+
+    def counting_rect(*rect_args):
+        rects_created[0] += 1
+        return original_rect(*rect_args)
+
+    upgrades = {name: 0 for name in UPGRADE_NAMES}
+    simulation = Simulation(upgrades, 1)
+    ticks = args.frames * 100
+
+    def legacy_check(player, obstacle_manager):
+        # What check_collisions did before: fresh inflated rects for the player and every obstacle
+        store = obstacle_manager.obstacles
+        player_rect = pygame.Rect(player.x, player.y, player.rect.width, player.rect.height)
+        player_rect.inflate_ip(-8, -8)
+        for i in range(store.count):
+            obstacle_rect = pygame.Rect(store.x[i], store.y[i], store.width[i], store.height[i])
+            obstacle_rect.inflate_ip(-4, -4)
+            if player_rect.colliderect(obstacle_rect):
+                return i
+        return -1
+
+    def current_check(player, obstacle_manager):
+        return obstacle_manager.find_collision(player)
+
+    def run(check, traced):
+        # Bytes come from a traced pass with nothing but the check between the readings, so
+        # each one is the check's own transient peak; timings come from an untraced pass
+        simulation.reset(1)
+        step_rects = 0
+        check_rects = 0
+        transient_bytes = 0
+        check_time = 0.0
+        if traced:
+            tracemalloc.start()
+        for tick in range(ticks):
+            rects_created[0] = 0
+            if simulation.step(INPUT_JUMP if tick % 40 == 0 else 0):
+                simulation.reset(tick)
+                rects_created[0] = 0
+            step_rects += rects_created[0]
+
+            rects_created[0] = 0
+            if traced:
+                tracemalloc.reset_peak()
+                current = tracemalloc.get_traced_memory()[0]
+                check(simulation.player, simulation.obstacle_manager)
+                transient_bytes += tracemalloc.get_traced_memory()[1] - current
+            else:
+                start = time.perf_counter()
+                check(simulation.player, simulation.obstacle_manager)
+                check_time += time.perf_counter() - start
+            check_rects += rects_created[0]
+        if traced:
+            tracemalloc.stop()
+        return step_rects + check_rects, transient_bytes, check_time
+
+    pygame.Rect = counting_rect
+    try:
+        # Ticks are stepped without the counter; resets allocate a fresh run on purpose
+        print(f"{'path':>8} {'Rects/tick':>11} {'bytes/check':>12} {'us/check':>9}")
+        for name, check in (("legacy", legacy_check), ("current", current_check)):
+            rects, transient_bytes, _ = run(check, True)
+            _, _, check_time = run(check, False)
+            print(f"{name:>8} {rects / ticks:>11.2f} "
+                  f"{transient_bytes / ticks:>12.1f} {check_time / ticks * 1e6:>9.2f}")
+    finally:
+        pygame.Rect = original_rect
+
+
+def bench_collision(args):
+    from constants import INPUT_JUMP, UPGRADE_NAMES
+    from simulation import Simulation
+
+    upgrades = {name: 0 for name in UPGRADE_NAMES}
+    simulation = Simulation(upgrades, 1)
+    ticks = args.frames * 100
+
+    def rect_check(player, obstacle_manager):
+        # The previous rule: bounding boxes inset by 4px (player) and 2px (cactus) per side
+        player_rect = player.get_rect().inflate(-8, -8)
+        store = obstacle_manager.obstacles
+        for i in range(store.count):
+            left = int(store.x[i]) + 2
+            top = store.y[i] + 2
+            if (left < player_rect.right and player_rect.left < left + store.width[i] - 4 and
+                    top < player_rect.bottom and player_rect.top < top + store.height[i] - 4):
+                return i
+        return -1
+
+    def mask_check(player, obstacle_manager):
+        return obstacle_manager.find_collision(player)
+
+    rect_time = 0.0
+    mask_time = 0.0
+    broadphase_hits = 0
+    rect_hits = 0
+    mask_hits = 0
+    for tick in range(ticks):
+        # Shield stays up so runs are long and every overlap gets measured instead of ending the run
+        simulation.player.shield_duration = 2
+        simulation.step(INPUT_JUMP if tick % 97 == 0 else 0)
+        player = simulation.player
+        obstacle_manager = simulation.obstacle_manager
+
+        start = time.perf_counter()
+        rect_hit = rect_check(player, obstacle_manager)
+        rect_time += time.perf_counter() - start
+
+        start = time.perf_counter()
+        mask_hit = mask_check(player, obstacle_manager)
+        mask_time += time.perf_counter() - start
+
+        broadphase_hits += player.get_rect().collidelist(obstacle_manager.obstacles.rects) >= 0
+        rect_hits += rect_hit >= 0
+        mask_hits += mask_hit >= 0
+
+    print(f"{ticks} ticks, {broadphase_hits} broadphase candidates")
+    print(f"{'check':>6} {'us/tick':>8} {'hits':>6}")
+    print(f"{'rect':>6} {rect_time / ticks * 1e6:>8.2f} {rect_hits:>6}")
+    print(f"{'mask':>6} {mask_time / ticks * 1e6:>8.2f} {mask_hits:>6}")
+
+
+def bench_background(args):
+    import pygame
+    from constants import WIDTH, HEIGHT
+    from background_system import BackgroundManager
+    from utils import draw_pixel_art_batch
+
+    pygame.init()
+    pygame.display.set_mode((WIDTH, HEIGHT))
+    win = pygame.Surface((WIDTH, HEIGHT))
+    background = BackgroundManager(random.Random(1))
+
+    def sprite_draw():
+        # The per-element path the layers replaced: one atlas blit per visible sprite
+        background.update()
+        for layer in (background.mountains, background.clouds):
+            shift = layer.get_shift()
+            draw_pixel_art_batch(
+                win,
+                [(layer.patterns[pattern_id], (x - shift) % layer.tile_width, y)
+                 for pattern_id, x, y in layer.placements],
+                layer.color
+            )
+
+    def layer_draw():
+        background.update()
+        background.draw(win)
+
+    print(f"{'path':>8} {'ms/frame':>9}")
+    print(f"{'sprites':>8} {time_frames(args.frames, sprite_draw):>9.4f}")
+    print(f"{'layers':>8} {time_frames(args.frames, layer_draw):>9.4f}")
+
+    pygame.quit()
+
+
+def bench_screens(args):
+    import tempfile
+    import pygame
+    from text_cache import get_text_cache
+
+    # GameManager loads and saves its files in the working directory, so give it an empty
+    # one instead of the player's save and settings
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as directory:
+        os.chdir(directory)
+        try:
+            from game_manager import GameManager
+
+            game_manager = GameManager()
+            game_manager.settings_system.data["fullscreen"] = False
+            game_manager.display_system.update_display()
+            win = game_manager.display_system.get_virtual_screen()
+            game_manager.change_state("game")
+            game_manager.change_state("game_over")
+
+            print(f"{'screen':>10} {'ms/frame':>9}")
+            for name in ("menu", "game", "game_over"):
+                state = game_manager.states[name]
+                state.draw(win)
+                print(f"{name:>10} {time_frames(args.frames, lambda: state.draw(win)):>9.4f}")
+        finally:
+            os.chdir(cwd)
+
+    stats = get_text_cache().get_stats()
+    print(f"text cache: {stats['hits']} hits, {stats['misses']} misses, "
+          f"{stats['size']}/{stats['max_size']} surfaces")
+
+    pygame.quit()
+
+
+BENCHMARKS = {
+    "allocations": bench_allocations,
+    "background": bench_background,
+    "collision": bench_collision,
+    "scaling": bench_scaling,
+    "screens": bench_screens,
+    "simulation": bench_simulation,
+    "vector": bench_vector,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rogue Dino performance benchmarks")
+    parser.add_argument("benchmark", choices=sorted(BENCHMARKS))
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--headless", action="store_true", help="use SDL's dummy video driver")
+    parser.add_argument("--envs", type=int, nargs="+", default=[64, 1024, 16384],
+                        help="batch sizes for the vector benchmark")
+    args = parser.parse_args()
+
+    if args.headless:
+        os.environ["SDL_VIDEODRIVER"] = "dummy"
+
+    BENCHMARKS[args.benchmark](args)
+
+
+if __name__ == "__main__":
+    main()
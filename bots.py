@@ -0,0 +1,101 @@
+import random
+from constants import INPUT_JUMP, INPUT_SHIELD, INPUT_DASH
+
+
+class Bot:
+    # A bot looks at the simulation once per tick and returns the input bits it presses
+    def __init__(self, seed=None):
+        pass
+
+    def reset(self, seed=None):
+        pass
+
+    def act(self, simulation):
+        return 0
+
+
+class IdleBot(Bot):
+    pass
+
+
+class RandomBot(Bot):
+    def __init__(self, seed=None, press_chance=0.05):
+        self.press_chance = press_chance
+        self.rng = random.Random(seed)
+
+    def reset(self, seed=None):
+        self.rng.seed(seed)
+
+    def act(self, simulation):
+        if self.rng.random() < self.press_chance:
+            return self.rng.choice((INPUT_JUMP, INPUT_SHIELD, INPUT_DASH))
+        return 0
+
+
+class HeuristicBot(Bot):
+    def __init__(self, seed=None, jump_lead=9, reaction_jitter=0.0):
+        # Ticks of travel before the player's front edge the obstacle is jumped at
+        self.jump_lead = jump_lead
+        # Standard deviation of the timing error, drawn once per obstacle
+        self.reaction_jitter = reaction_jitter
+        self.rng = random.Random(seed)
+        self.target_x = None
+        self.target_lead = jump_lead
+
+    def reset(self, seed=None):
+        self.rng.seed(seed)
+        self.target_x = None
+
+    def act(self, simulation):
+        player = simulation.player
+        upgrades = simulation.upgrades
+        obstacle_manager = simulation.obstacle_manager
+        obstacles = obstacle_manager.obstacles
+        index = obstacle_manager.get_next_obstacle(player.x)
+        if index < 0:
+            return 0
+
+        # Obstacles only move left, so a next obstacle further right than last tick's is a new one
+        obstacle_x = obstacles.x[index]
+        if self.target_x is None or obstacle_x > self.target_x:
+            self.target_lead = self.jump_lead + self.rng.gauss(0, self.reaction_jitter)
+        self.target_x = obstacle_x
+        lead = self.target_lead
+
+        speed = obstacle_manager.current_speed - upgrades["slow_motion"] * 0.5
+        gap = int(obstacle_x) - player.get_rect().right
+        ticks_away = gap / speed
+
+        pressed = 0
+        if player.on_ground:
+            if ticks_away <= lead:
+                pressed |= INPUT_JUMP
+                # Tall cacti can still clip the landing, so cover it with the shield when there is one
+                if (upgrades["shield"] > 0 and player.shield_cooldown == 0 and
+                        obstacles.height[index] > 64):
+                    pressed |= INPUT_SHIELD
+        elif player.vel_y > 0 and 0 < ticks_away <= lead:
+            # Coming down onto the next obstacle: extend the hop or dash over it
+            if upgrades["air_jump"] > 0 and not player.air_jump_used:
+                pressed |= INPUT_JUMP
+            elif upgrades["air_dash"] > 0 and not player.air_dash_used and player.dash_cooldown == 0:
+                pressed |= INPUT_DASH
+        return pressed
+
+
+class CasualBot(HeuristicBot):
+    # Same strategy with human-like timing errors, so runs end at a realistic spread of scores
+    def __init__(self, seed=None):
+        super().__init__(seed, reaction_jitter=4)
+
+
+BOTS = {
+    "idle": IdleBot,
+    "random": RandomBot,
+    "heuristic": HeuristicBot,
+    "casual": CasualBot
+}
+
+
+def create_bot(name, seed=None):
+    return BOTS[name](seed)
@@ -0,0 +1,21 @@
+import pygame
+from constants import BLOCK_SIZE, DINO, DINO_FRAMES, CACTUS_PATTERNS
+
+
+def create_mask(pattern, block_size=BLOCK_SIZE):
+    width = len(pattern[0]) * block_size
+    height = len(pattern) * block_size
+    mask = pygame.mask.Mask((width, height))
+    block = pygame.mask.Mask((block_size, block_size), fill=True)
+
+    for y, row in enumerate(pattern):
+        for x, val in enumerate(row):
+            if val == 1:
+                mask.draw(block, (x * block_size, y * block_size))
+    return mask
+
+
+# Built once at import; masks need no display, so headless simulations can use them too
+DINO_MASKS = [create_mask(pattern) for pattern in DINO]
+DINO_FRAME_MASKS = [create_mask(pattern) for pattern in DINO_FRAMES]
+CACTUS_MASKS = [create_mask(pattern) for pattern in CACTUS_PATTERNS]
@@ -33,18 +33,47 @@ class ColorManager:
             "BUTTON_HOVER": (235, 220, 190)  # Hover cream
         }
     
+        self.scheme_colors = {
+            1: self.base_colors,
+            2: self.old_paper_colors,
+            3: {name: self.invert_color(color) for name, color in self.base_colors.items()}
+        }
+        
+        self.poster_colors = {
+            1: {  # Normal
+                "background": (139, 115, 85),  # Western brown
+                "border": (101, 67, 33),  # Dark brown
+                "text": (255, 248, 220),  # Cream
+                "accent": (205, 175, 149)  # Light brown
+            },
+            2: {  # Old paper
+                "background": (139, 115, 85),  # Dark brown
+                "border": (101, 78, 57),  # Darker brown
+                "text": (250, 240, 210),  # Light cream
+                "accent": (205, 175, 140)  # Accent brown
+            },
+            3: {  # Inverted
+                "background": (50, 50, 50),  # Dark gray
+                "border": (20, 20, 20),  # Very dark gray
+                "text": (200, 200, 200),  # Light gray
+                "accent": (150, 150, 150)  # Medium gray
+            }
+        }
+        
+        # Bumped on every scheme change so callers can cache resolved colors
+        self.version = 0
+    
+    def set_color_scheme(self, scheme):
+        if scheme != self.settings_system.data["color_scheme"]:
+            self.settings_system.change_color_scheme(scheme)
+            self.version += 1
+    
     def invert_color(self, color):
         return (255 - color[0], 255 - color[1], 255 - color[2])
     
     def get_colors(self):
         scheme = self.settings_system.data["color_scheme"]
-        
-        if scheme == 2:  # Old paper
-            return self.old_paper_colors
-        elif scheme == 3:  # Inverted
-            return {name: self.invert_color(color) for name, color in self.base_colors.items()}
-        else:  # Normal 
-            return self.base_colors
+        return self.scheme_colors.get(scheme, self.base_colors)
     
     def get_color(self, color_name):
         colors = self.get_colors()
@@ -52,25 +81,4 @@ class ColorManager:
     
     def get_poster_colors(self):
         scheme = self.settings_system.data["color_scheme"]
-        
-        if scheme == 2:  # Old paper 
-            return {
-                "background": (139, 115, 85),  # Dark brown
-                "border": (101, 78, 57),  # Darker brown
-                "text": (250, 240, 210),  # Light cream
-                "accent": (205, 175, 140)  # Accent brown
-            }
-        elif scheme == 3:  # Inverted 
-            return {
-                "background": (50, 50, 50),  # Dark gray
-                "border": (20, 20, 20),  # Very dark gray
-                "text": (200, 200, 200),  # Light gray
-                "accent": (150, 150, 150)  # Medium gray
-            }
-        else:  # Normal 
-            return {
-                "background": (139, 115, 85),  # Western brown
-                "border": (101, 67, 33),  # Dark brown
-                "text": (255, 248, 220),  # Cream
-                "accent": (205, 175, 149)  # Light brown
-            }
\ No newline at end of file
+        return self.poster_colors.get(scheme, self.poster_colors[1])
@@ -0,0 +1,43 @@
+import pygame
+from constants import get_color_version
+from sprite_atlas import TRANSPARENT_KEY
+
+
+class StaticLayer:
+    # Drawn once into its own surface and only redrawn when the color scheme or the target
+    # size changes. Transparent layers are colorkeyed, so anything antialiased on them has to
+    # sit on something opaque drawn in the same layer
+    def __init__(self, render, transparent=False):
+        self.render = render
+        self.transparent = transparent
+        self.surface = None
+        self.key = None
+
+    def get_surface(self, size):
+        key = (get_color_version(), size)
+        if key != self.key:
+            self.key = key
+            self.surface = pygame.Surface(size)
+            if pygame.display.get_surface() is not None:
+                self.surface = self.surface.convert()
+            if self.transparent:
+                self.surface.fill(TRANSPARENT_KEY)
+            self.render(self.surface)
+            if self.transparent:
+                self.surface.set_colorkey(TRANSPARENT_KEY, pygame.RLEACCEL)
+        return self.surface
+
+
+class Compositor:
+    # Paints layers bottom to top: StaticLayers are a single blit, anything else is a
+    # callable that draws straight onto the target every frame
+    def __init__(self, layers):
+        self.layers = layers
+
+    def draw(self, win):
+        size = win.get_size()
+        for layer in self.layers:
+            if isinstance(layer, StaticLayer):
+                win.blit(layer.get_surface(size), (0, 0))
+            else:
+                layer(win)
@@ -2,6 +2,8 @@ import pygame
 
 WIDTH, HEIGHT = 800, 400
 FPS = 60
+TICK_RATE = 60  # Simulation ticks per second, independent of the render rate
+MAX_FRAME_TIME = 0.25  # Longest frame the simulation will catch up on
 GROUND_Y = 350
 BLOCK_SIZE = 2 # Resolution
 
@@ -25,11 +27,51 @@ SHOP = 2
 SETTINGS = 3
 GAME_OVER = 4
 
+# Per-tick input bits fed to the simulation; a bit is set on the tick its key goes down
+INPUT_JUMP = 1
+INPUT_SHIELD = 2
+INPUT_DASH = 4
+
+SCORE_MULTIPLIERS = [1, 10, 100, 1000]
+
+UPGRADE_NAMES = (
+    "jump_boost",
+    "coin_multiplier",
+    "speed_boost",
+    "shield",
+    "slow_motion",
+    "shield_upgrade",
+    "slow_acceleration",
+    "air_jump",
+    "air_dash",
+    "dash_distance",
+    "dodge_chance",
+    "bonus_health",
+    "score_multiplier"
+)
+
 SAVE_FILE = "dino_save.json"
 SETTINGS_FILE = "dino_settings.json"
+REPLAY_FILE = "dino_replay.json"
+BALANCE_CACHE_FILE = "dino_balance_cache.json"
 
 _color_manager = None
 
+_default_colors = {
+    "WHITE": WHITE,
+    "LIGHT_GRAY": LIGHT_GRAY,
+    "MEDIUM_GRAY": MEDIUM_GRAY,
+    "GRAY": GRAY,
+    "DARK_GRAY": DARK_GRAY,
+    "BLACK": BLACK,
+    "VERY_DARK": VERY_DARK,
+    "UI_BACKGROUND": UI_BACKGROUND,
+    "UI_BORDER": UI_BORDER,
+    "UI_TEXT": UI_TEXT,
+    "UI_ACCENT": UI_ACCENT,
+    "BUTTON_HOVER": BUTTON_HOVER
+}
+
 def set_color_manager(color_manager):
     global _color_manager
     _color_manager = color_manager
@@ -38,20 +80,12 @@ def get_colors():
     if _color_manager:
         return _color_manager.get_colors()
     else:
-        return {
-            "WHITE": WHITE,
-            "LIGHT_GRAY": LIGHT_GRAY,
-            "MEDIUM_GRAY": MEDIUM_GRAY,
-            "GRAY": GRAY,
-            "DARK_GRAY": DARK_GRAY,
-            "BLACK": BLACK,
-            "VERY_DARK": VERY_DARK,
-            "UI_BACKGROUND": UI_BACKGROUND,
-            "UI_BORDER": UI_BORDER,
-            "UI_TEXT": UI_TEXT,
-            "UI_ACCENT": UI_ACCENT,
-            "BUTTON_HOVER": BUTTON_HOVER
-        }
+        return _default_colors
+
+def get_color_version():
+    if _color_manager:
+        return _color_manager.version
+    return 0
 
 def get_color(color_name):
     if _color_manager:
@@ -0,0 +1,81 @@
+from constants import WIDTH, HEIGHT, UPGRADE_NAMES
+from constants import INPUT_JUMP, INPUT_SHIELD, INPUT_DASH
+from simulation import Simulation, new_seed
+
+ACTION_NOOP = 0
+ACTION_JUMP = 1
+ACTION_SHIELD = 2
+ACTION_DASH = 3
+
+ACTION_INPUTS = (0, INPUT_JUMP, INPUT_SHIELD, INPUT_DASH)
+
+NEXT_OBSTACLES = 3
+OBSERVATION_SIZE = 2 + NEXT_OBSTACLES * 3 + 6
+
+
+class DinoEnv:
+    # reset/step interface over the headless Simulation; nothing here touches the display
+    def __init__(self, upgrades=None, frame_skip=1, max_ticks=None):
+        if upgrades is None:
+            upgrades = {name: 0 for name in UPGRADE_NAMES}
+        self.upgrades = dict(upgrades)
+        self.frame_skip = max(1, frame_skip)
+        self.max_ticks = max_ticks
+        self.num_actions = len(ACTION_INPUTS)
+        self.observation_size = OBSERVATION_SIZE
+        self.simulation = Simulation(self.upgrades, new_seed())
+
+    def reset(self, seed=None):
+        self.simulation.reset(new_seed() if seed is None else seed)
+        return self.get_observation()
+
+    def step(self, action):
+        simulation = self.simulation
+        previous_score = simulation.score
+
+        # The action is a key press, so it only lands on the first of the skipped ticks
+        pressed = ACTION_INPUTS[action]
+        for i in range(self.frame_skip):
+            if simulation.step(pressed):
+                break
+            pressed = 0
+
+        truncated = self.max_ticks is not None and simulation.tick >= self.max_ticks
+        done = simulation.game_over or truncated
+        info = {
+            "score": simulation.score,
+            "coins": simulation.coins_this_run,
+            "ticks": simulation.tick,
+            "cause_of_death": simulation.cause_of_death,
+            "truncated": truncated and not simulation.game_over
+        }
+        return self.get_observation(), simulation.score - previous_score, done, info
+
+    def get_observation(self):
+        player = self.simulation.player
+        obstacle_manager = self.simulation.obstacle_manager
+
+        observation = [player.y / HEIGHT, player.vel_y / 15]
+
+        obstacles = obstacle_manager.obstacles
+        ahead = obstacle_manager.get_obstacles_ahead(player.x)
+        for i in range(NEXT_OBSTACLES):
+            if i < len(ahead):
+                index = ahead[i]
+                observation.extend((
+                    (int(obstacles.x[index]) - player.x) / WIDTH,
+                    obstacles.width[index] / 100,
+                    obstacles.height[index] / 100
+                ))
+            else:
+                observation.extend((1.0, 0.0, 0.0))
+
+        observation.extend((
+            obstacle_manager.current_speed / 10,
+            player.shield_duration / player.max_shield_duration,
+            player.shield_cooldown / player.max_shield_cooldown,
+            player.dash_cooldown / player.max_dash_cooldown,
+            float(player.on_ground),
+            float(player.air_jump_used)
+        ))
+        return observation
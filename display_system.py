@@ -1,5 +1,7 @@
 import pygame
 import math
+from font_registry import get_font
+from text_cache import render_text
 
 class DisplaySystem:
     def __init__(self, settings_system, color_manager):
@@ -14,8 +16,16 @@ class DisplaySystem:
         self.screen = None
         self.display_rect = pygame.Rect(0, 0, self.base_width, self.base_height)
         
-        self.poster_font = pygame.font.Font(None, 36)
-        self.poster_small_font = pygame.font.Font(None, 24)
+        # Regions of the virtual screen that changed this frame, in virtual coordinates
+        self.dirty_rects = []
+        self.needs_full_redraw = True
+        
+        # Fullscreen frame around the game, rebuilt on layout or color scheme changes
+        self.poster_frame = None
+        self.poster_frame_key = None
+        
+        self.poster_font = get_font(36)
+        self.poster_small_font = get_font(24)
         
         self.init_display()
     
@@ -27,6 +37,9 @@ class DisplaySystem:
             width, height = self.settings_system.get_scaled_resolution()
             self.screen = pygame.display.set_mode((width, height))
             self.display_rect = pygame.Rect(0, 0, width, height)
+        
+        self.configure_scaling()
+        self.invalidate()
     
     def calculate_fullscreen_layout(self):
         screen_width = self.screen.get_width()
@@ -43,53 +56,150 @@ class DisplaySystem:
         y = (screen_height - target_height) // 2
         
         self.display_rect = pygame.Rect(x, y, target_width, target_height)
+        self.poster_frame = None
+    
+    def configure_scaling(self):
+        # Match the display format so scaling can write straight into the window
+        self.virtual_screen = self.virtual_screen.convert()
+        self.viewport = self.screen.subsurface(self.display_rect)
+        
+        self.scale_x = self.display_rect.width / self.base_width
+        self.scale_y = self.display_rect.height / self.base_height
+        
+        if self.scale_x == 1 and self.scale_y == 1:
+            self.scale_mode = "native"
+        elif self.scale_x.is_integer() and self.scale_y.is_integer():
+            self.scale_mode = "integer"
+        else:
+            self.scale_mode = "fractional"
     
     def get_virtual_screen(self):
         return self.virtual_screen
     
+    def mark_dirty(self, rect):
+        self.dirty_rects.append(pygame.Rect(rect))
+    
+    def invalidate(self):
+        self.needs_full_redraw = True
+    
     def present(self):
+        if (self.settings_system.data["dirty_rects"] and 
+            not self.needs_full_redraw and self.dirty_rects):
+            self.present_dirty()
+        else:
+            self.present_full()
+        
+        self.dirty_rects.clear()
+        self.needs_full_redraw = False
+    
+    def present_full(self):
         if self.settings_system.data["fullscreen"]:
-            self.draw_poster_background()
+            self.screen.blit(self.get_poster_frame(), (0, 0))
         
-        if self.display_rect.size != (self.base_width, self.base_height):
-            scaled_surface = pygame.transform.scale(self.virtual_screen, self.display_rect.size)
-            self.screen.blit(scaled_surface, self.display_rect)
-        else:
-            self.screen.blit(self.virtual_screen, self.display_rect)
+        self.scale_to_viewport()
         
         pygame.display.flip()
     
-    def draw_poster_background(self):
+    def scale_to_viewport(self):
+        if self.scale_mode == "native":
+            self.viewport.blit(self.virtual_screen, (0, 0))
+        else:
+            # Scale into the window itself instead of allocating a new frame every present
+            pygame.transform.scale(self.virtual_screen, self.display_rect.size, self.viewport)
+    
+    def present_dirty(self):
+        bounds = self.virtual_screen.get_rect()
+        regions = []
+        for rect in self.merge_rects(self.dirty_rects):
+            rect = rect.clip(bounds)
+            if rect.width > 0 and rect.height > 0:
+                regions.append(rect)
+        
+        if not regions:
+            return
+        
+        update_rects = []
+        if self.scale_mode == "native":
+            for rect in regions:
+                dest = rect.move(self.display_rect.topleft)
+                self.screen.blit(self.virtual_screen, dest, rect)
+                update_rects.append(dest)
+        elif self.scale_mode == "integer":
+            # Each virtual pixel maps to a whole block, so regions scale independently
+            for rect in regions:
+                dest = self.to_display_rect(rect)
+                pygame.transform.scale(
+                    self.virtual_screen.subsurface(rect),
+                    dest.size,
+                    self.screen.subsurface(dest)
+                )
+                update_rects.append(dest)
+        else:
+            # Fractional scales resample the full frame so region edges match a full present,
+            # but only the dirty regions are pushed to the display
+            self.scale_to_viewport()
+            for rect in regions:
+                update_rects.append(self.to_display_rect(rect).clip(self.display_rect))
+        
+        pygame.display.update(update_rects)
+    
+    def to_display_rect(self, rect):
+        left = self.display_rect.x + int(rect.left * self.scale_x)
+        top = self.display_rect.y + int(rect.top * self.scale_y)
+        right = self.display_rect.x + math.ceil(rect.right * self.scale_x)
+        bottom = self.display_rect.y + math.ceil(rect.bottom * self.scale_y)
+        return pygame.Rect(left, top, right - left, bottom - top)
+    
+    def merge_rects(self, rects):
+        merged = []
+        for rect in rects:
+            rect = rect.copy()
+            index = rect.collidelist(merged)
+            while index != -1:
+                rect.union_ip(merged.pop(index))
+                index = rect.collidelist(merged)
+            merged.append(rect)
+        return merged
+    
+    def get_poster_frame(self):
+        key = (self.screen.get_size(), tuple(self.display_rect), self.color_manager.version)
+        if self.poster_frame is None or self.poster_frame_key != key:
+            self.poster_frame = pygame.Surface(self.screen.get_size()).convert()
+            self.draw_poster_background(self.poster_frame)
+            self.poster_frame_key = key
+        return self.poster_frame
+    
+    def draw_poster_background(self, surface):
         colors = self.color_manager.get_poster_colors()
         
-        self.screen.fill(colors["background"])
+        surface.fill(colors["background"])
         
-        self.draw_poster_border(colors)
+        self.draw_poster_border(surface, colors)
         
-        self.draw_poster_decorations(colors)
+        self.draw_poster_decorations(surface, colors)
     
-    def draw_poster_border(self, colors):
-        screen_width = self.screen.get_width()
-        screen_height = self.screen.get_height()
+    def draw_poster_border(self, surface, colors):
+        screen_width = surface.get_width()
+        screen_height = surface.get_height()
         
         border_width = 20
         
-        pygame.draw.rect(self.screen, colors["border"], 
+        pygame.draw.rect(surface, colors["border"], 
                         (self.display_rect.x - border_width, 
                          self.display_rect.y - border_width,
                          self.display_rect.width + border_width * 2,
                          self.display_rect.height + border_width * 2))
         
         inner_border = 5
-        pygame.draw.rect(self.screen, colors["accent"],
+        pygame.draw.rect(surface, colors["accent"],
                         (self.display_rect.x - inner_border,
                          self.display_rect.y - inner_border,
                          self.display_rect.width + inner_border * 2,
                          self.display_rect.height + inner_border * 2))
         
-        self.draw_corner_decorations(colors)
+        self.draw_corner_decorations(surface, colors)
     
-    def draw_corner_decorations(self, colors):
+    def draw_corner_decorations(self, surface, colors):
         corner_size = 40
         
         points = [
@@ -97,60 +207,60 @@ class DisplaySystem:
             (self.display_rect.x - 20 + corner_size, self.display_rect.y - 20),
             (self.display_rect.x - 20, self.display_rect.y - 20 + corner_size)
         ]
-        pygame.draw.polygon(self.screen, colors["text"], points)
+        pygame.draw.polygon(surface, colors["text"], points)
         
         points = [
             (self.display_rect.right + 20, self.display_rect.y - 20),
             (self.display_rect.right + 20 - corner_size, self.display_rect.y - 20),
             (self.display_rect.right + 20, self.display_rect.y - 20 + corner_size)
         ]
-        pygame.draw.polygon(self.screen, colors["text"], points)
+        pygame.draw.polygon(surface, colors["text"], points)
         
         points = [
             (self.display_rect.x - 20, self.display_rect.bottom + 20),
             (self.display_rect.x - 20 + corner_size, self.display_rect.bottom + 20),
             (self.display_rect.x - 20, self.display_rect.bottom + 20 - corner_size)
         ]
-        pygame.draw.polygon(self.screen, colors["text"], points)
+        pygame.draw.polygon(surface, colors["text"], points)
         
         points = [
             (self.display_rect.right + 20, self.display_rect.bottom + 20),
             (self.display_rect.right + 20 - corner_size, self.display_rect.bottom + 20),
             (self.display_rect.right + 20, self.display_rect.bottom + 20 - corner_size)
         ]
-        pygame.draw.polygon(self.screen, colors["text"], points)
+        pygame.draw.polygon(surface, colors["text"], points)
     
-    def draw_poster_decorations(self, colors):
-        screen_width = self.screen.get_width()
+    def draw_poster_decorations(self, surface, colors):
+        screen_width = surface.get_width()
         
         title_y = max(50, self.display_rect.y - 80)
-        title_text = self.poster_font.render("ROGUE DINO", True, colors["text"])
+        title_text = render_text(self.poster_font, "ROGUE DINO", True, colors["text"])
         title_rect = title_text.get_rect(center=(screen_width // 2, title_y))
-        self.screen.blit(title_text, title_rect)
+        surface.blit(title_text, title_rect)
         
-        if self.display_rect.bottom + 60 < self.screen.get_height():
-            bottom_text = self.poster_small_font.render("Press ESC for Menu", True, colors["accent"])
+        if self.display_rect.bottom + 60 < surface.get_height():
+            bottom_text = render_text(self.poster_small_font, "Press ESC for Menu", True, colors["accent"])
             bottom_rect = bottom_text.get_rect(center=(screen_width // 2, self.display_rect.bottom + 40))
-            self.screen.blit(bottom_text, bottom_rect)
+            surface.blit(bottom_text, bottom_rect)
         
-        self.draw_stars(colors)
+        self.draw_stars(surface, colors)
     
-    def draw_stars(self, colors):
+    def draw_stars(self, surface, colors):
         star_size = 8
         
         left_x = self.display_rect.x - 60
         if left_x > star_size * 2:
             for i in range(3):
                 y = self.display_rect.y + (self.display_rect.height // 4) * (i + 1)
-                self.draw_star(left_x, y, star_size, colors["accent"])
+                self.draw_star(surface, left_x, y, star_size, colors["accent"])
         
         right_x = self.display_rect.right + 60
-        if right_x < self.screen.get_width() - star_size * 2:
+        if right_x < surface.get_width() - star_size * 2:
             for i in range(3):
                 y = self.display_rect.y + (self.display_rect.height // 4) * (i + 1)
-                self.draw_star(right_x, y, star_size, colors["accent"])
+                self.draw_star(surface, right_x, y, star_size, colors["accent"])
     
-    def draw_star(self, x, y, size, color):
+    def draw_star(self, surface, x, y, size, color):
         points = []
         for i in range(10):
             angle = math.pi * i / 5
@@ -163,7 +273,7 @@ class DisplaySystem:
             star_y = y + radius * math.sin(angle - math.pi / 2)
             points.append((star_x, star_y))
         
-        pygame.draw.polygon(self.screen, color, points)
+        pygame.draw.polygon(surface, color, points)
     
     def update_display(self):
         self.init_display()
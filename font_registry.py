@@ -0,0 +1,14 @@
+import pygame
+
+_fonts = {}
+
+
+def get_font(size, face=None):
+    key = (face, size)
+    font = _fonts.get(key)
+    if font is None:
+        if not pygame.font.get_init():
+            pygame.font.init()
+        font = pygame.font.Font(face, size)
+        _fonts[key] = font
+    return font
@@ -1,17 +1,22 @@
 import sys
+import time
 import pygame
-from constants import WIDTH, HEIGHT, FPS, set_color_manager
-from game_states import MenuState, GameState_Playing, GameOverState
+from constants import WIDTH, HEIGHT, TICK_RATE, MAX_FRAME_TIME, set_color_manager
+from game_states import MenuState, GameState_Playing, GameOverState, ReplayState
+from replay import Replay
 from save_system import SaveSystem
 from shop import Shop
 from settings_system import SettingsSystem
 from color_manager import ColorManager
 from display_system import DisplaySystem
 from settings_menu import SettingsMenu
+from soak_monitor import SoakMonitor
+
+EXPOSE_EVENTS = (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED)
 
 
 class GameManager:
-    def __init__(self):
+    def __init__(self, autopilot=False, soak_interval=60.0, soak_log=None, soak_trace_memory=False):
         pygame.init()
         self.save_system = SaveSystem()
         self.settings_system = SettingsSystem()
@@ -26,18 +31,41 @@ class GameManager:
         pygame.display.set_caption("Rogue Dino")
         self.clock = pygame.time.Clock()
         
+        # Fraction of a simulation tick left over when a frame is drawn, used to interpolate positions
+        self.render_alpha = 1.0
+        
+        self.autopilot = False
+        self.soak_interval = soak_interval
+        self.soak_log = soak_log
+        self.soak_trace_memory = soak_trace_memory
+        self.soak_monitor = None
+        
         self.current_state_name = "menu"
         self.states = {
             "menu": MenuState(self),
             "game": None,
             "shop": self.shop,
             "settings": self.settings_menu,
-            "game_over": None
+            "game_over": None,
+            "replay": None
         }
+        
+        if autopilot:
+            self.change_state("autopilot")
 
     def change_state(self, new_state_name):
-        if new_state_name == "game":
-            self.states["game"] = GameState_Playing(self)
+        if new_state_name == "autopilot":
+            self.autopilot = True
+            if self.soak_monitor is None:
+                self.soak_monitor = SoakMonitor(self.soak_interval, self.soak_log, self.soak_trace_memory)
+            self.soak_monitor.start()
+            self.start_game()
+            new_state_name = "game"
+        elif new_state_name == "game":
+            self.stop_autopilot()
+            self.start_game()
+        elif new_state_name == "menu":
+            self.stop_autopilot()
         elif new_state_name == "game_over":
             if self.states["game"]:
                 game_state = self.states["game"]
@@ -46,6 +74,12 @@ class GameManager:
                     game_state.score, 
                     game_state.coins_this_run
                 )
+        elif new_state_name == "replay":
+            try:
+                self.states["replay"] = ReplayState(self, Replay.load())
+            except Exception as e:
+                print(f"Error loading replay: {e}")
+                return
         elif new_state_name == "apply_resolution":
             self.display_system.update_display()
             return  
@@ -58,6 +92,18 @@ class GameManager:
             sys.exit()
         
         self.current_state_name = new_state_name
+        self.display_system.invalidate()
+
+    def stop_autopilot(self):
+        if self.autopilot and self.soak_monitor:
+            self.soak_monitor.stop()
+        self.autopilot = False
+
+    def start_game(self):
+        if self.states["game"] is None:
+            self.states["game"] = GameState_Playing(self)
+        else:
+            self.states["game"].reset_game()
 
     def handle_custom_keybinds(self, event):
         if event.type == pygame.KEYDOWN and self.current_state_name == "game":
@@ -78,9 +124,17 @@ class GameManager:
 
     def run(self):
         running = True
+        tick_duration = 1.0 / TICK_RATE
+        accumulator = 0.0
+        previous_time = time.perf_counter()
         
         while running:
-            self.clock.tick(FPS)
+            self.clock.tick(self.settings_system.data["frame_limit"])
+            
+            current_time = time.perf_counter()
+            frame_time = current_time - previous_time
+            accumulator += min(frame_time, MAX_FRAME_TIME)
+            previous_time = current_time
             
             current_state = self.states.get(self.current_state_name)
             if not current_state:
@@ -89,6 +143,9 @@ class GameManager:
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     running = False
+                elif event.type in EXPOSE_EVENTS:
+                    # The window contents were lost, so partial presents would leave it stale
+                    self.display_system.invalidate()
                 else:
                     custom_result = self.handle_custom_keybinds(event)
                     if custom_result:
@@ -109,15 +166,26 @@ class GameManager:
                         else:
                             self.change_state(result)
             
-            if hasattr(current_state, 'update'):
-                result = current_state.update()
-                if result and result != self.current_state_name:
-                    self.change_state(result)
+            while accumulator >= tick_duration:
+                accumulator -= tick_duration
+                current_state = self.states.get(self.current_state_name)
+                if hasattr(current_state, 'update'):
+                    result = current_state.update()
+                    if result and result != self.current_state_name:
+                        self.change_state(result)
+            
+            self.render_alpha = accumulator / tick_duration
             
+            current_state = self.states.get(self.current_state_name)
             virtual_screen = self.display_system.get_virtual_screen()
             current_state.draw(virtual_screen)
             
             self.display_system.present()
+            
+            if self.soak_monitor and self.autopilot:
+                # Only the frame's own work; frame_time also includes the limiter's sleep
+                work_time = time.perf_counter() - current_time
+                self.soak_monitor.record_frame(work_time, current_state)
         
         pygame.quit()
-        sys.exit()
\ No newline at end of file
+        sys.exit()
@@ -1,17 +1,32 @@
+import random
 import pygame
-from constants import HEIGHT, WIDTH, GROUND_Y, get_colors, get_color
-from obstacle import ObstacleManager
-from player import Player
+from constants import HEIGHT, WIDTH, GROUND_Y, TICK_RATE, get_colors, get_color
+from constants import INPUT_JUMP, INPUT_SHIELD, INPUT_DASH
+from simulation import Simulation, new_seed
+from replay import ReplayRecorder, ReplayPlayer, KEYFRAME_INTERVAL
 from background_system import BackgroundManager
+from bots import HeuristicBot
+from hud import HUD
+from compositor import Compositor, StaticLayer
+from font_registry import get_font
+from text_cache import render_text
+
+INPUT_ACTIONS = (
+    ("jump", INPUT_JUMP),
+    ("shield", INPUT_SHIELD),
+    ("dash", INPUT_DASH)
+)
+
+REPLAY_SPEEDS = [1, 2, 4, 8, 16, 32, 64]
 
 
 class GameState:
     def __init__(self, game_manager):
         self.game_manager = game_manager
-        self.title_font = pygame.font.Font(None, 48)
-        self.font = pygame.font.Font(None, 36)
-        self.small_font = pygame.font.Font(None, 24)
-        self.tiny_font = pygame.font.Font(None, 20)
+        self.title_font = get_font(48)
+        self.font = get_font(36)
+        self.small_font = get_font(24)
+        self.tiny_font = get_font(20)
 
     def handle_event(self, event):
         return None
@@ -22,11 +37,34 @@ class GameState:
     def draw(self, win):
         pass
 
+    def draw_backdrop(self, surface):
+        surface.fill(get_colors()["WHITE"])
+
+    def draw_ground(self, surface):
+        pygame.draw.line(surface, get_colors()["MEDIUM_GRAY"], (0, GROUND_Y), (WIDTH, GROUND_Y), 2)
+
 
 class MenuState(GameState):
     def __init__(self, game_manager):
         super().__init__(game_manager)
         self.background = BackgroundManager()
+        
+        title_box_width = min(600, WIDTH - 40)
+        title_box_height = 250
+        title_box_y = max(60, HEIGHT // 6)
+        self.title_box = pygame.Rect((WIDTH - title_box_width) // 2, title_box_y, title_box_width, title_box_height)
+        
+        stats_box_width = min(400, WIDTH - 40)
+        stats_box_height = 100
+        stats_box_y = min(self.title_box.bottom + 20, HEIGHT - stats_box_height - 20)
+        self.stats_box = pygame.Rect((WIDTH - stats_box_width) // 2, stats_box_y, stats_box_width, stats_box_height)
+        
+        self.compositor = Compositor([
+            self.draw_backdrop,
+            self.draw_background,
+            StaticLayer(self.draw_panels, transparent=True),
+            self.draw_stats
+        ])
     
     def update(self):
         self.background.update()
@@ -40,6 +78,8 @@ class MenuState(GameState):
                 return "shop"
             elif event.key == pygame.K_o:  
                 return "settings"
+            elif event.key == pygame.K_a:
+                return "autopilot"
             elif event.key == pygame.K_ESCAPE:
                 return "quit"
         return None
@@ -53,37 +93,28 @@ class MenuState(GameState):
             return str(num)
 
     def draw(self, win):
+        self.compositor.draw(win)
+
+    def draw_background(self, win):
+        self.background.draw(win, self.game_manager.render_alpha)
+
+    def draw_panels(self, surface):
         colors = get_colors()
         
-        win.fill(colors["WHITE"])
+        self.draw_ground(surface)
         
-        self.background.draw(win)
+        title_box = self.title_box
+        pygame.draw.rect(surface, colors["WHITE"], title_box)
+        pygame.draw.rect(surface, colors["GRAY"], title_box, 3)
         
-        pygame.draw.line(win, colors["MEDIUM_GRAY"], (0, GROUND_Y), (WIDTH, GROUND_Y), 2)
+        title = render_text(self.title_font, "ROGUE DINO", True, colors["UI_TEXT"])
+        subtitle = render_text(self.font, "by samuli100", True, colors["UI_ACCENT"])
         
-        title_box_width = min(600, WIDTH - 40)  
-        title_box_height = 250
-        title_box_x = (WIDTH - title_box_width) // 2
-        title_box_y = max(60, HEIGHT // 6)  
-        
-        pygame.draw.rect(win, colors["WHITE"], (title_box_x, title_box_y, title_box_width, title_box_height))
-        pygame.draw.rect(win, colors["GRAY"], (title_box_x, title_box_y, title_box_width, title_box_height), 3)
-        
-        title = self.title_font.render("ROGUE DINO", True, colors["UI_TEXT"])
-        subtitle = self.font.render("by samuli100", True, colors["UI_ACCENT"])
+        title_rect = title.get_rect(center=(WIDTH//2, title_box.y + 50))
+        subtitle_rect = subtitle.get_rect(center=(WIDTH//2, title_box.y + 90))
         
-        title_rect = title.get_rect(center=(WIDTH//2, title_box_y + 50))
-        subtitle_rect = subtitle.get_rect(center=(WIDTH//2, title_box_y + 90))
-        
-        win.blit(title, title_rect)
-        win.blit(subtitle, subtitle_rect)
-        
-        score_mult = self.game_manager.save_system.get_score_multiplier()
-        if score_mult > 1:
-            mult_text = f"{score_mult}x Score Multiplier Active!"
-            mult_surface = self.small_font.render(mult_text, True, colors["DARK_GRAY"])
-            mult_rect = mult_surface.get_rect(center=(WIDTH//2, title_box_y + 120))
-            win.blit(mult_surface, mult_rect)
+        surface.blit(title, title_rect)
+        surface.blit(subtitle, subtitle_rect)
         
         controls = [
             ("SPACE", "Start Game"),
@@ -92,53 +123,88 @@ class MenuState(GameState):
             ("ESC", "Exit")
         ]
         
-        y_offset = title_box_y + 150
+        y_offset = title_box.y + 150
         for key, action in controls:
-            key_text = self.small_font.render(f"[{key}]", True, colors["DARK_GRAY"])
-            action_text = self.small_font.render(action, True, colors["UI_TEXT"])
+            key_text = render_text(self.small_font, f"[{key}]", True, colors["DARK_GRAY"])
+            action_text = render_text(self.small_font, action, True, colors["UI_TEXT"])
             
             key_width = key_text.get_width()
             total_width = key_width + 10 + action_text.get_width()
             start_x = (WIDTH - total_width) // 2
             
-            win.blit(key_text, (start_x, y_offset))
-            win.blit(action_text, (start_x + key_width + 10, y_offset))
+            surface.blit(key_text, (start_x, y_offset))
+            surface.blit(action_text, (start_x + key_width + 10, y_offset))
             y_offset += 25
         
-        stats_box_width = min(400, WIDTH - 40)
-        stats_box_height = 100
-        stats_box_x = (WIDTH - stats_box_width) // 2
-        stats_box_y = min(title_box_y + title_box_height + 20, HEIGHT - stats_box_height - 20)
+        stats_box = self.stats_box
+        pygame.draw.rect(surface, colors["UI_BACKGROUND"], stats_box)
+        pygame.draw.rect(surface, colors["GRAY"], stats_box, 2)
         
-        pygame.draw.rect(win, colors["UI_BACKGROUND"], (stats_box_x, stats_box_y, stats_box_width, stats_box_height))
-        pygame.draw.rect(win, colors["GRAY"], (stats_box_x, stats_box_y, stats_box_width, stats_box_height), 2)
+        autopilot_surface = render_text(self.tiny_font, "[A] Autopilot", True, colors["GRAY"])
+        autopilot_rect = autopilot_surface.get_rect(bottomright=(stats_box.right - 20, stats_box.bottom - 15))
+        surface.blit(autopilot_surface, autopilot_rect)
+
+    def draw_stats(self, win):
+        # Everything here can change between visits to the menu; it all sits on opaque panels
+        colors = get_colors()
         
+        score_mult = self.game_manager.save_system.get_score_multiplier()
+        if score_mult > 1:
+            mult_text = f"{score_mult}x Score Multiplier Active!"
+            mult_surface = render_text(self.small_font, mult_text, True, colors["DARK_GRAY"])
+            mult_rect = mult_surface.get_rect(center=(WIDTH//2, self.title_box.y + 120))
+            win.blit(mult_surface, mult_rect)
+        
+        stats_box = self.stats_box
         coins_text = f"Coins: {self.format_number(self.game_manager.save_system.data['coins'])}"
         score_text = f"High Score: {self.format_number(self.game_manager.save_system.data['high_score'])}"
         
-        coins_surface = self.small_font.render(coins_text, True, colors["UI_ACCENT"])
-        score_surface = self.small_font.render(score_text, True, colors["UI_TEXT"])
+        coins_surface = render_text(self.small_font, coins_text, True, colors["UI_ACCENT"])
+        score_surface = render_text(self.small_font, score_text, True, colors["UI_TEXT"])
         
-        if coins_surface.get_width() > stats_box_width - 40 or score_surface.get_width() > stats_box_width - 40:
-            coins_surface = self.tiny_font.render(coins_text, True, colors["UI_ACCENT"])
-            score_surface = self.tiny_font.render(score_text, True, colors["UI_TEXT"])
+        if coins_surface.get_width() > stats_box.width - 40 or score_surface.get_width() > stats_box.width - 40:
+            coins_surface = render_text(self.tiny_font, coins_text, True, colors["UI_ACCENT"])
+            score_surface = render_text(self.tiny_font, score_text, True, colors["UI_TEXT"])
         
-        win.blit(coins_surface, (stats_box_x + 20, stats_box_y + 25))
-        win.blit(score_surface, (stats_box_x + 20, stats_box_y + 50))
+        win.blit(coins_surface, (stats_box.x + 20, stats_box.y + 25))
+        win.blit(score_surface, (stats_box.x + 20, stats_box.y + 50))
 
 
 class GameState_Playing(GameState):
     def __init__(self, game_manager):
         super().__init__(game_manager)
-        self.background = BackgroundManager()
+        # Owns its cosmetic stream so each run can reseed it in place
+        self.background = BackgroundManager(random.Random())
+        self.hud = HUD()
+        self.prev_sprite_rects = []
+        self.bot = None
+        self.simulation = None
+        self.compositor = Compositor([
+            self.draw_backdrop,
+            self.draw_background,
+            StaticLayer(self.draw_ground, transparent=True),
+            self.draw_scene
+        ])
         self.reset_game()
 
     def reset_game(self):
+        # Restarts reuse the simulation, background and their entities in place
         upgrades = self.game_manager.save_system.data["upgrades"]
-        self.player = Player(upgrades, self.game_manager.settings_system)
-        self.obstacle_manager = ObstacleManager()
-        self.background.reset()
-        self.base_score = 0
+        seed = new_seed()
+        if self.simulation is None:
+            self.simulation = Simulation(dict(upgrades), seed)
+        else:
+            self.simulation.reset(seed, dict(upgrades))
+        self.recorder = ReplayRecorder(seed, upgrades)
+        self.player = self.simulation.player
+        self.obstacle_manager = self.simulation.obstacle_manager
+        self.background.reset(self.simulation.create_cosmetic_rng(self.background.rng))
+        # The autopilot presses keys through the same input bits as the keyboard
+        if not self.game_manager.autopilot:
+            self.bot = None
+        elif self.bot is None:
+            self.bot = HeuristicBot()
+        self.held_input = 0
         self.score = 0
         self.coins_this_run = 0
         self.dodge_notification_timer = 0
@@ -151,27 +217,45 @@ class GameState_Playing(GameState):
                 return "menu"
         return None
 
+    def read_input(self):
+        keys = pygame.key.get_pressed()
+        settings_system = self.game_manager.settings_system
+        
+        held = 0
+        for action, bit in INPUT_ACTIONS:
+            key = settings_system.get_keybind(action)
+            if key != pygame.K_UNKNOWN and keys[key]:
+                held |= bit
+        
+        # The simulation only sees keys on the tick they go down
+        pressed = held & ~self.held_input
+        self.held_input = held
+        
+        if self.bot:
+            pressed |= self.bot.act(self.simulation)
+        return pressed
+
     def update(self):
-        upgrades = self.game_manager.save_system.data["upgrades"]
-        
         self.background.update()
         
-        self.obstacle_manager.update(upgrades)
-        
-        self.player.update(upgrades, self.obstacle_manager.current_speed)
-        
-        passed_obstacles = self.obstacle_manager.count_passed_obstacles()
-        if passed_obstacles > 0:
-            coins_earned = passed_obstacles * (1 + upgrades["coin_multiplier"])
-            self.coins_this_run += coins_earned
-            self.game_manager.save_system.add_coins(coins_earned)
-        
-        self.base_score += 1
-        
-        score_multiplier = self.game_manager.save_system.get_score_multiplier()
-        self.score = self.base_score * score_multiplier
-        
-        if self.obstacle_manager.check_collisions(self.player, upgrades):
+        pressed = self.read_input()
+        self.recorder.record(pressed)
+        game_over = self.simulation.step(pressed)
+        
+        # Autopilot runs don't earn coins or high scores for the player
+        if self.simulation.coins_earned > 0 and not self.bot:
+            self.game_manager.save_system.add_coins(self.simulation.coins_earned)
+        self.coins_this_run = self.simulation.coins_this_run
+        self.score = self.simulation.score
+        
+        if game_over:
+            self.recorder.finish(self.simulation).save()
+            if self.bot:
+                if self.game_manager.soak_monitor:
+                    self.game_manager.soak_monitor.record_run(self.simulation)
+                self.reset_game()
+                self.game_manager.display_system.invalidate()
+                return None
             return "game_over"
         
         if self.dodge_notification_timer > 0:
@@ -188,31 +272,51 @@ class GameState_Playing(GameState):
             return str(num)
 
     def draw(self, win):
+        self.compositor.draw(win)
+
+    def draw_background(self, win):
+        self.background.draw(win, self.game_manager.render_alpha)
+
+    def draw_scene(self, win):
         colors = get_colors()
         
-        win.fill(colors["WHITE"])
-        
-        self.background.draw(win)
-        
-        pygame.draw.line(win, colors["MEDIUM_GRAY"], (0, GROUND_Y), (WIDTH, GROUND_Y), 2)
+        alpha = self.game_manager.render_alpha
         
-        self.player.draw(win)
-        self.obstacle_manager.draw(win)
+        self.player.draw(win, alpha)
+        self.obstacle_manager.draw(win, alpha)
         
         self.draw_hud(win)
         
+        sprite_rects = [self.player.get_draw_rect(alpha)]
+        sprite_rects.extend(self.obstacle_manager.get_draw_rects(alpha))
+        sprite_rects.extend(self.background.get_draw_rects(alpha))
+        
         if self.dodge_notification_timer > 0:
-            dodge_text = self.font.render("LUCKY DODGE!", True, colors["DARK_GRAY"])
+            dodge_text = render_text(self.font, "LUCKY DODGE!", True, colors["DARK_GRAY"])
             dodge_rect = dodge_text.get_rect(center=(WIDTH//2, HEIGHT//2 - 50))
             win.blit(dodge_text, dodge_rect)
+            sprite_rects.append(dodge_rect)
+        
+        self.report_dirty_rects(sprite_rects)
+
+    def report_dirty_rects(self, sprite_rects):
+        # Everything that moves was drawn either last frame or this frame
+        display_system = self.game_manager.display_system
+        for rect in self.prev_sprite_rects:
+            display_system.mark_dirty(rect)
+        for rect in sprite_rects:
+            display_system.mark_dirty(rect)
+        for rect in self.hud.dirty_rects:
+            display_system.mark_dirty(rect)
+        self.prev_sprite_rects = sprite_rects
 
     def draw_hud(self, win):
         colors = get_colors()
         upgrades = self.game_manager.save_system.data["upgrades"]
+        settings_system = self.game_manager.settings_system
+        hud = self.hud
         
-        hud_height = 100
-        pygame.draw.rect(win, colors["UI_BACKGROUND"], (0, 0, WIDTH, hud_height))
-        pygame.draw.line(win, colors["GRAY"], (0, hud_height), (WIDTH, hud_height), 1)
+        hud.begin_frame()
         
         score_multiplier = self.game_manager.save_system.get_score_multiplier()
         if score_multiplier > 1:
@@ -220,51 +324,36 @@ class GameState_Playing(GameState):
         else:
             score_text = f"Score: {self.format_number(self.score)}"
         
-        score_surface = self.font.render(score_text, True, colors["UI_TEXT"])
-        win.blit(score_surface, (WIDTH - score_surface.get_width() - 20, 15))
+        hud.set_widget("score", self.font, score_text, colors["UI_TEXT"], (WIDTH - 20, 15), True)
         
-        coins_text = self.small_font.render(
-            f"Coins: {self.format_number(self.game_manager.save_system.data['coins'])} (+{self.coins_this_run})", 
-            True, colors["UI_ACCENT"]
-        )
-        win.blit(coins_text, (20, 15))
+        coins_text = f"Coins: {self.format_number(self.game_manager.save_system.data['coins'])} (+{self.coins_this_run})"
+        hud.set_widget("coins", self.small_font, coins_text, colors["UI_ACCENT"], (20, 15))
         
         if upgrades["bonus_health"] > 0:
             health_text = f"Health: {self.player.current_health}/{self.player.max_health}"
-            health_surface = self.small_font.render(health_text, True, colors["UI_TEXT"])
-            win.blit(health_surface, (20, 40))
+            hud.set_widget("health", self.small_font, health_text, colors["UI_TEXT"], (20, 40))
         
-        jump_key = self.game_manager.settings_system.get_key_name(
-            self.game_manager.settings_system.get_keybind("jump")
-        )
-        shield_key = self.game_manager.settings_system.get_key_name(
-            self.game_manager.settings_system.get_keybind("shield")
-        )
-        dash_key = self.game_manager.settings_system.get_key_name(
-            self.game_manager.settings_system.get_keybind("dash")
-        )
-        menu_key = self.game_manager.settings_system.get_key_name(
-            self.game_manager.settings_system.get_keybind("menu")
-        )
+        jump_key = settings_system.get_key_name(settings_system.get_keybind("jump"))
+        shield_key = settings_system.get_key_name(settings_system.get_keybind("shield"))
+        dash_key = settings_system.get_key_name(settings_system.get_keybind("dash"))
+        menu_key = settings_system.get_key_name(settings_system.get_keybind("menu"))
         
         if self.player.shield_cooldown > 0:
             cooldown_seconds = self.player.shield_cooldown // 60 + 1
-            cooldown_text = self.small_font.render(f"Shield: {cooldown_seconds}s cooldown", True, colors["GRAY"])
-            win.blit(cooldown_text, (20, 65))
+            hud.set_widget("shield", self.small_font, f"Shield: {cooldown_seconds}s cooldown", colors["GRAY"], (20, 65))
         elif upgrades["shield"] > 0:
-            shield_text = self.small_font.render(f"Shield: Ready [{shield_key}]", True, colors["DARK_GRAY"])
-            win.blit(shield_text, (20, 65))
+            hud.set_widget("shield", self.small_font, f"Shield: Ready [{shield_key}]", colors["DARK_GRAY"], (20, 65))
+        else:
+            hud.hide_widget("shield")
         
         speed_text = f"Speed: {self.obstacle_manager.current_speed:.1f}"
-        speed_surface = self.tiny_font.render(speed_text, True, colors["GRAY"])
-        win.blit(speed_surface, (WIDTH - speed_surface.get_width() - 20, 45))
+        hud.set_widget("speed", self.tiny_font, speed_text, colors["GRAY"], (WIDTH - 20, 45), True)
         
         hud_y = 40
         if upgrades["air_jump"] > 0:
             air_jump_color = colors["GRAY"] if self.player.air_jump_used else colors["DARK_GRAY"]
             air_jump_text = "Air Jump: Used" if self.player.air_jump_used else "Air Jump: Ready"
-            air_jump_surface = self.tiny_font.render(air_jump_text, True, air_jump_color)
-            win.blit(air_jump_surface, (200, hud_y))
+            hud.set_widget("air_jump", self.tiny_font, air_jump_text, air_jump_color, (200, hud_y))
             hud_y += 15
             
         if upgrades["air_dash"] > 0:
@@ -282,20 +371,19 @@ class GameState_Playing(GameState):
                 dash_text = f"Air Dash: Ready [{dash_key}]"
                 dash_color = colors["DARK_GRAY"]
             
-            air_dash_surface = self.tiny_font.render(dash_text, True, dash_color)
-            win.blit(air_dash_surface, (200, hud_y))
+            hud.set_widget("air_dash", self.tiny_font, dash_text, dash_color, (200, hud_y))
             
         destroyed_count = self.obstacle_manager.get_destroyed_count()
         if destroyed_count > 0:
             destroyed_text = f"Obstacles Destroyed: +{destroyed_count}"
-            destroyed_surface = self.tiny_font.render(destroyed_text, True, colors["UI_ACCENT"])
-            win.blit(destroyed_surface, (400, 40))
+            hud.set_widget("destroyed", self.tiny_font, destroyed_text, colors["UI_ACCENT"], (400, 40))
+        else:
+            hud.hide_widget("destroyed")
         
-        controls_text = self.tiny_font.render(
-            f"{jump_key}: Jump • {shield_key}: Shield • {dash_key}: Air Dash • {menu_key}: Menu", 
-            True, colors["GRAY"]
-        )
-        win.blit(controls_text, (WIDTH - controls_text.get_width() - 20, 75))
+        controls_text = f"{jump_key}: Jump • {shield_key}: Shield • {dash_key}: Air Dash • {menu_key}: Menu"
+        hud.set_widget("controls", self.tiny_font, controls_text, colors["GRAY"], (WIDTH - 20, 75), True)
+        
+        hud.draw(win)
 
 
 class GameOverState(GameState):
@@ -305,11 +393,14 @@ class GameOverState(GameState):
         self.coins_earned = coins_earned
         self.new_high_score = game_manager.save_system.update_high_score(final_score)
         game_manager.save_system.save_data()
+        self.compositor = Compositor([StaticLayer(self.draw_screen)])
 
     def handle_event(self, event):
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_r:
                 return "game"
+            elif event.key == pygame.K_p:
+                return "replay"
             elif event.key == pygame.K_m:
                 return "menu"
             elif event.key == pygame.K_ESCAPE:
@@ -325,12 +416,16 @@ class GameOverState(GameState):
             return str(num)
 
     def draw(self, win):
+        # Nothing on this screen changes while it is up
+        self.compositor.draw(win)
+
+    def draw_screen(self, win):
         colors = get_colors()
         
         win.fill(colors["UI_BACKGROUND"])
         
         box_width = 500
-        box_height = 320
+        box_height = 345
         box_x = (WIDTH - box_width) // 2
         box_y = (HEIGHT - box_height) // 2
         
@@ -344,37 +439,38 @@ class GameOverState(GameState):
             title_text = "GAME OVER"
             title_color = colors["UI_TEXT"]
             
-        title_surface = self.title_font.render(title_text, True, title_color)
+        title_surface = render_text(self.title_font, title_text, True, title_color)
         title_rect = title_surface.get_rect(center=(WIDTH//2, box_y + 50))
         win.blit(title_surface, title_rect)
         
         score_text = f"Final Score: {self.format_number(self.final_score)}"
-        score_surface = self.font.render(score_text, True, colors["UI_TEXT"])
+        score_surface = render_text(self.font, score_text, True, colors["UI_TEXT"])
         score_rect = score_surface.get_rect(center=(WIDTH//2, box_y + 100))
         win.blit(score_surface, score_rect)
         
         score_multiplier = self.game_manager.save_system.get_score_multiplier()
         if score_multiplier > 1:
             mult_text = f"({score_multiplier}x Score Multiplier Applied)"
-            mult_surface = self.small_font.render(mult_text, True, colors["UI_ACCENT"])
+            mult_surface = render_text(self.small_font, mult_text, True, colors["UI_ACCENT"])
             mult_rect = mult_surface.get_rect(center=(WIDTH//2, box_y + 125))
             win.blit(mult_surface, mult_rect)
         
         coins_text = f"Coins Earned: {self.format_number(self.coins_earned)}"
-        coins_surface = self.small_font.render(coins_text, True, colors["UI_ACCENT"])
+        coins_surface = render_text(self.small_font, coins_text, True, colors["UI_ACCENT"])
         coins_rect = coins_surface.get_rect(center=(WIDTH//2, box_y + 160))
         win.blit(coins_surface, coins_rect)
         
         controls = [
             ("R", "Restart"),
+            ("P", "Watch Replay"),
             ("M", "Menu"),
             ("ESC", "Quit")
         ]
         
         y_offset = box_y + 210
         for key, action in controls:
-            key_text = self.small_font.render(f"[{key}]", True, colors["DARK_GRAY"])
-            action_text = self.small_font.render(action, True, colors["UI_TEXT"])
+            key_text = render_text(self.small_font, f"[{key}]", True, colors["DARK_GRAY"])
+            action_text = render_text(self.small_font, action, True, colors["UI_TEXT"])
             
             key_width = key_text.get_width()
             total_width = key_width + 10 + action_text.get_width()
@@ -382,4 +478,87 @@ class GameOverState(GameState):
             
             win.blit(key_text, (start_x, y_offset))
             win.blit(action_text, (start_x + key_width + 10, y_offset))
-            y_offset += 25
\ No newline at end of file
+            y_offset += 25
+
+
+class ReplayState(GameState):
+    def __init__(self, game_manager, replay):
+        super().__init__(game_manager)
+        self.replay = replay
+        self.background = BackgroundManager()
+        self.player = ReplayPlayer(replay, background=self.background)
+        self.speed_index = 0
+        self.paused = False
+        self.compositor = Compositor([
+            self.draw_backdrop,
+            self.draw_background,
+            StaticLayer(self.draw_ground, transparent=True),
+            self.draw_scene
+        ])
+
+    def handle_event(self, event):
+        if event.type == pygame.KEYDOWN:
+            if event.key in (pygame.K_ESCAPE, pygame.K_m):
+                return "menu"
+            elif event.key == pygame.K_SPACE:
+                self.paused = not self.paused
+            elif event.key == pygame.K_UP:
+                self.speed_index = min(self.speed_index + 1, len(REPLAY_SPEEDS) - 1)
+            elif event.key == pygame.K_DOWN:
+                self.speed_index = max(self.speed_index - 1, 0)
+            elif event.key == pygame.K_RIGHT:
+                self.player.seek(self.player.tick + KEYFRAME_INTERVAL)
+            elif event.key == pygame.K_LEFT:
+                self.player.seek(self.player.tick - KEYFRAME_INTERVAL)
+            elif event.key == pygame.K_HOME:
+                self.player.seek(0)
+        return None
+
+    def update(self):
+        if not self.paused:
+            # Fast-forward runs several ticks per update; only the last one gets drawn
+            self.player.advance(REPLAY_SPEEDS[self.speed_index])
+        return None
+
+    def format_time(self, ticks):
+        seconds = ticks // TICK_RATE
+        return f"{seconds // 60}:{seconds % 60:02d}"
+
+    def get_alpha(self):
+        # Interpolating only makes sense when every tick is shown
+        if REPLAY_SPEEDS[self.speed_index] == 1 and not self.paused and not self.player.is_finished():
+            return self.game_manager.render_alpha
+        return 1.0
+
+    def draw(self, win):
+        self.compositor.draw(win)
+
+    def draw_background(self, win):
+        self.background.draw(win, self.get_alpha())
+
+    def draw_scene(self, win):
+        colors = get_colors()
+        simulation = self.player.simulation
+        speed = REPLAY_SPEEDS[self.speed_index]
+        alpha = self.get_alpha()
+        
+        simulation.player.draw(win, alpha)
+        simulation.obstacle_manager.draw(win, alpha)
+        
+        if self.paused:
+            status = "PAUSED"
+        elif self.player.is_finished():
+            status = "END"
+        else:
+            status = f"{speed}x"
+        
+        info_text = (
+            f"REPLAY {status}  {self.format_time(simulation.tick)} / {self.format_time(self.replay.ticks)}"
+            f"  Score: {simulation.score}"
+        )
+        info_surface = render_text(self.small_font, info_text, True, colors["UI_TEXT"])
+        win.blit(info_surface, (10, 10))
+        
+        help_text = "UP/DOWN: Speed  LEFT/RIGHT: Seek 10s  HOME: Restart  SPACE: Pause  ESC: Menu"
+        help_surface = render_text(self.tiny_font, help_text, True, colors["GRAY"])
+        win.blit(help_surface, (10, HEIGHT - 25))
@@ -0,0 +1,69 @@
+import pygame
+from constants import WIDTH, get_colors, get_color_version
+from text_cache import render_text
+
+HUD_HEIGHT = 100
+
+
+class HUD:
+    def __init__(self, width=WIDTH, height=HUD_HEIGHT):
+        self.width = width
+        self.height = height
+        self.surface = pygame.Surface((width, height + 1))
+        
+        # name -> (key, surface, rect) of what is currently drawn on the HUD surface
+        self.widgets = {}
+        self.dirty_rects = []
+        self.color_version = None
+
+    def rebuild(self):
+        colors = get_colors()
+        self.surface.fill(colors["UI_BACKGROUND"])
+        pygame.draw.line(self.surface, colors["GRAY"], (0, self.height), (self.width, self.height), 1)
+        self.widgets.clear()
+        self.dirty_rects = [self.surface.get_rect()]
+
+    def begin_frame(self):
+        self.dirty_rects = []
+        version = get_color_version()
+        if version != self.color_version:
+            self.color_version = version
+            self.rebuild()
+
+    def set_widget(self, name, font, text, color, pos, align_right=False):
+        key = (text, color, pos, align_right)
+        current = self.widgets.get(name)
+        if current and current[0] == key:
+            return
+        
+        if current and current[2]:
+            self.clear_rect(current[2], name)
+        
+        if text is None:
+            self.widgets[name] = (key, None, None)
+            return
+        
+        surface = render_text(font, text, True, color)
+        if align_right:
+            rect = surface.get_rect(topright=pos)
+        else:
+            rect = surface.get_rect(topleft=pos)
+        
+        self.surface.blit(surface, rect)
+        self.widgets[name] = (key, surface, rect)
+        self.dirty_rects.append(rect)
+
+    def hide_widget(self, name):
+        self.set_widget(name, None, None, None, None)
+
+    def clear_rect(self, rect, cleared_name):
+        self.surface.fill(get_colors()["UI_BACKGROUND"], rect)
+        self.dirty_rects.append(rect)
+        
+        # Repaint neighbours whose text overlapped the cleared area
+        for name, (key, surface, widget_rect) in self.widgets.items():
+            if name != cleared_name and widget_rect and widget_rect.colliderect(rect):
+                self.surface.blit(surface, widget_rect)
+
+    def draw(self, win):
+        win.blit(self.surface, (0, 0))
@@ -1,6 +1,20 @@
+import argparse
 from game_manager import GameManager
 
 
+def parse_args():
+    parser = argparse.ArgumentParser(description="Rogue Dino")
+    parser.add_argument("--autopilot", action="store_true",
+                        help="let the heuristic bot play and restart on death, for soak testing")
+    parser.add_argument("--soak-interval", type=float, default=60.0,
+                        help="seconds between soak monitor samples")
+    parser.add_argument("--soak-log", help="CSV file to write soak monitor samples to")
+    parser.add_argument("--soak-trace-memory", action="store_true",
+                        help="trace Python heap usage with tracemalloc for half of each soak interval")
+    return parser.parse_args()
+
+
 if __name__ == "__main__":
-    game = GameManager()
-    game.run()
\ No newline at end of file
+    args = parse_args()
+    game = GameManager(args.autopilot, args.soak_interval, args.soak_log, args.soak_trace_memory)
+    game.run()
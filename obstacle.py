@@ -1,57 +1,92 @@
 import random
 import pygame
-from constants import WIDTH, GROUND_Y, BLOCK_SIZE, get_color
-from utils import draw_pixel_art
+from constants import WIDTH, GROUND_Y, BLOCK_SIZE
+from utils import draw_pixel_art_batch, lerp
 from constants import CACTUS_PATTERNS
+from collision_masks import CACTUS_MASKS
+
+CACTUS_WIDTHS = [len(pattern[0]) * BLOCK_SIZE for pattern in CACTUS_PATTERNS]
+CACTUS_HEIGHTS = [len(pattern) * BLOCK_SIZE for pattern in CACTUS_PATTERNS]
+
+# Obstacles spawn at least 60 ticks apart and leave within ~200, so a handful are alive at once
+MAX_OBSTACLES = 16
+
+
+class ObstacleStore:
+    # Struct-of-arrays obstacle storage: one preallocated list per field, live rows packed
+    # at the front, removal swaps the last row into the hole
+    def __init__(self, capacity=MAX_OBSTACLES):
+        self.capacity = capacity
+        self.x = [0.0] * capacity
+        self.prev_x = [0.0] * capacity
+        self.y = [0] * capacity
+        self.width = [0] * capacity
+        self.height = [0] * capacity
+        self.pattern_id = [0] * capacity
+        # Bounding rect per row for the collision broadphase; rows past count are kept
+        # zero-sized so collidelist can run over the whole list
+        self.rects = [pygame.Rect(0, 0, 0, 0) for i in range(capacity)]
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def grow(self):
+        extra = self.capacity
+        for field in (self.x, self.prev_x, self.y, self.width, self.height, self.pattern_id):
+            field.extend([0] * extra)
+        self.rects.extend(pygame.Rect(0, 0, 0, 0) for i in range(extra))
+        self.capacity += extra
+
+    def add(self, pattern_id, x, y):
+        if self.count == self.capacity:
+            self.grow()
+        index = self.count
+        self.x[index] = x
+        self.prev_x[index] = x
+        self.y[index] = y
+        self.width[index] = CACTUS_WIDTHS[pattern_id]
+        self.height[index] = CACTUS_HEIGHTS[pattern_id]
+        self.pattern_id[index] = pattern_id
+        self.rects[index].update(int(x), y, self.width[index], self.height[index])
+        self.count += 1
+        return index
+
+    def remove(self, index):
+        last = self.count - 1
+        if index != last:
+            self.x[index] = self.x[last]
+            self.prev_x[index] = self.prev_x[last]
+            self.y[index] = self.y[last]
+            self.width[index] = self.width[last]
+            self.height[index] = self.height[last]
+            self.pattern_id[index] = self.pattern_id[last]
+            self.rects[index], self.rects[last] = self.rects[last], self.rects[index]
+        self.rects[last].width = 0
+        self.count = last
+
+    def clear(self):
+        for i in range(self.count):
+            self.rects[i].width = 0
+        self.count = 0
+
+    def get_state(self):
+        return tuple(
+            (self.pattern_id[i], self.x[i], self.prev_x[i])
+            for i in range(self.count)
+        )
+
+    def set_state(self, state):
+        self.clear()
+        for pattern_id, x, prev_x in state:
+            index = self.add(pattern_id, x, GROUND_Y - CACTUS_HEIGHTS[pattern_id])
+            self.prev_x[index] = prev_x
 
-class Obstacle:
-    def __init__(self, x, y, speed):
-        self.x = x
-        self.y = y
-        self.speed = speed
-
-    def update(self):
-        self.x -= self.speed
-
-    def is_off_screen(self):
-        return self.x + self.get_width() < 0
-
-    def get_width(self):
-        return 0
-
-    def get_rect(self):
-        return pygame.Rect(0, 0, 0, 0)
-
-    def draw(self, win):
-        pass
-
-class Cactus(Obstacle):
-    def __init__(self, speed, slow_motion_level):
-        self.pattern = random.choice(CACTUS_PATTERNS)
-        x = WIDTH
-        y = GROUND_Y - len(self.pattern) * BLOCK_SIZE
-        final_speed = speed - slow_motion_level * 0.5
-        super().__init__(x, y, final_speed)
-
-    def get_width(self):
-        return len(self.pattern[0]) * BLOCK_SIZE
-
-    def get_rect(self):
-        width = len(self.pattern[0]) * BLOCK_SIZE
-        height = len(self.pattern) * BLOCK_SIZE
-        return pygame.Rect(self.x, self.y, width, height)
-
-    def get_collision_rect(self):
-        rect = self.get_rect()
-        rect.inflate_ip(-4, -4)
-        return rect
-
-    def draw(self, win):
-        draw_pixel_art(win, self.pattern, self.x, self.y, get_color("DARK_GRAY"))
 
 class ObstacleManager:
-    def __init__(self):
-        self.obstacles = []
+    def __init__(self, rng=random):
+        self.rng = rng
+        self.obstacles = ObstacleStore()
         self.spawn_timer = 0
         self.base_speed = 6
         self.current_speed = self.base_speed
@@ -71,12 +106,21 @@ class ObstacleManager:
         
         if self.should_spawn():
             self.spawn_obstacle(upgrades)
-            
-        for obstacle in self.obstacles[:]:
-            obstacle.speed = self.current_speed - upgrades["slow_motion"] * 0.5
-            obstacle.update()
-            if obstacle.is_off_screen():
-                self.obstacles.remove(obstacle)
+        
+        store = self.obstacles
+        xs = store.x
+        prev_xs = store.prev_x
+        widths = store.width
+        rects = store.rects
+        speed = self.current_speed - upgrades["slow_motion"] * 0.5
+        # Backwards, so a swap-removed row is always one that was already moved
+        for i in range(store.count - 1, -1, -1):
+            prev_xs[i] = xs[i]
+            xs[i] -= speed
+            if xs[i] + widths[i] < 0:
+                store.remove(i)
+            else:
+                rects[i].x = int(xs[i])
 
     def should_spawn(self):
         base_interval = 100
@@ -90,37 +134,64 @@ class ObstacleManager:
         return False
 
     def spawn_obstacle(self, upgrades):
-        cactus = Cactus(self.current_speed, upgrades["slow_motion"])
-        self.obstacles.append(cactus)
+        pattern_id = self.rng.randrange(len(CACTUS_PATTERNS))
+        self.obstacles.add(pattern_id, WIDTH, GROUND_Y - CACTUS_HEIGHTS[pattern_id])
+
+    def get_next_obstacle(self, x):
+        # Index of the nearest obstacle whose right edge is still past x, or -1
+        store = self.obstacles
+        xs = store.x
+        widths = store.width
+        nearest = -1
+        for i in range(store.count):
+            if xs[i] + widths[i] > x and (nearest < 0 or xs[i] < xs[nearest]):
+                nearest = i
+        return nearest
+
+    def get_obstacles_ahead(self, x):
+        store = self.obstacles
+        ahead = [i for i in range(store.count) if store.x[i] + store.width[i] > x]
+        ahead.sort(key=store.x.__getitem__)
+        return ahead
+
+    def find_collision(self, player):
+        # Spawns are at least 240px apart, so the player's bounding rect can only ever
+        # touch one obstacle and the first broadphase hit is the only candidate
+        store = self.obstacles
+        player_rect = player.get_rect()
+        hit = player_rect.collidelist(store.rects)
+        if hit < 0:
+            return -1
+        
+        rect = store.rects[hit]
+        offset = (rect.x - player_rect.x, rect.y - player_rect.y)
+        if player.get_mask().overlap(CACTUS_MASKS[store.pattern_id[hit]], offset) is None:
+            return -1
+        return hit
 
     def check_collisions(self, player, upgrades):
         if player.shield_active or player.invulnerable_timer > 0:
             return False
-            
-        player_rect = player.get_collision_rect()
         
-        for obstacle in self.obstacles[:]:
-            if hasattr(obstacle, 'get_collision_rect'):
-                obs_rect = obstacle.get_collision_rect()
-            else:
-                obs_rect = obstacle.get_rect()
-                
-            if player_rect.colliderect(obs_rect):
-                if player.is_dashing():
-                    self.obstacles.remove(obstacle)
-                    self.obstacles_destroyed_by_dash += 1
-                    return False
-                
-                self.obstacles.remove(obstacle)
-                
-                return player.take_damage(upgrades)
-        return False
+        hit = self.find_collision(player)
+        if hit < 0:
+            return False
+        
+        self.obstacles.remove(hit)
+        if player.is_dashing():
+            self.obstacles_destroyed_by_dash += 1
+            return False
+        
+        return player.take_damage(upgrades)
 
     def count_passed_obstacles(self):
         passed_count = 0
-        for obstacle in self.obstacles[:]:
-            if obstacle.x + obstacle.get_width() < 50:
-                self.obstacles.remove(obstacle)
+        store = self.obstacles
+        xs = store.x
+        widths = store.width
+        for i in range(store.count - 1, -1, -1):
+            if xs[i] + widths[i] < 50:
+                store.remove(i)
                 passed_count += 1
         return passed_count
 
@@ -129,13 +200,38 @@ class ObstacleManager:
         self.obstacles_destroyed_by_dash = 0
         return count
 
-    def draw(self, win):
-        for obstacle in self.obstacles:
-            obstacle.draw(win)
+    def draw(self, win, alpha=1.0):
+        store = self.obstacles
+        draw_pixel_art_batch(
+            win,
+            [(CACTUS_PATTERNS[store.pattern_id[i]], lerp(store.prev_x[i], store.x[i], alpha), store.y[i])
+             for i in range(store.count)],
+            "DARK_GRAY"
+        )
+
+    def get_state(self):
+        return (
+            self.spawn_timer,
+            self.current_speed,
+            self.game_time,
+            self.obstacles_destroyed_by_dash,
+            self.obstacles.get_state()
+        )
+
+    def set_state(self, state):
+        self.spawn_timer, self.current_speed, self.game_time, self.obstacles_destroyed_by_dash, obstacles = state
+        self.obstacles.set_state(obstacles)
+
+    def get_draw_rects(self, alpha=1.0):
+        store = self.obstacles
+        return [
+            pygame.Rect(lerp(store.prev_x[i], store.x[i], alpha), store.y[i], store.width[i], store.height[i])
+            for i in range(store.count)
+        ]
 
     def reset(self):
         self.obstacles.clear()
         self.spawn_timer = 0
         self.current_speed = self.base_speed
         self.game_time = 0
-        self.obstacles_destroyed_by_dash = 0
\ No newline at end of file
+        self.obstacles_destroyed_by_dash = 0
@@ -0,0 +1,95 @@
+import pygame
+from constants import WIDTH, BLOCK_SIZE, get_color, get_color_version
+from sprite_atlas import render_pattern, TRANSPARENT_INDEX, INK_INDEX, TRANSPARENT_KEY
+from utils import lerp
+
+
+class ParallaxLayer:
+    # A whole background layer pre-rendered into one strip. The strip holds a tile that
+    # repeats every tile_width pixels plus one extra screen of wrap-around, so any scroll
+    # position is a single blit of a screen-wide window out of it
+    def __init__(self, patterns, color, speed, top, height, tile_width=WIDTH * 2):
+        self.patterns = patterns
+        self.color = color
+        self.speed = speed
+        self.top = top
+        self.height = height
+        self.tile_width = tile_width
+        self.offset = 0.0
+        self.prev_offset = 0.0
+        self.placements = ()
+        self.area = pygame.Rect(0, 0, WIDTH, height)
+        # Sprites are rendered into an 8-bit palette strip like the atlas; what gets blitted
+        # is a display-format RLE copy of it, which skips the mostly empty strip in runs
+        self.strip = pygame.Surface((tile_width + WIDTH, height), 0, 8)
+        self.strip.set_palette_at(TRANSPARENT_INDEX, TRANSPARENT_KEY)
+        self.strip.set_colorkey(TRANSPARENT_INDEX)
+        self.surface = None
+        self.color_version = None
+
+    def __len__(self):
+        return len(self.placements)
+
+    def layout(self, placements):
+        # placements are (pattern index, x within the tile, y on screen)
+        self.placements = tuple(placements)
+        self.strip.fill(TRANSPARENT_INDEX)
+        for pattern_id, x, y in self.placements:
+            for copy_x in (x - self.tile_width, x, x + self.tile_width):
+                render_pattern(self.strip, self.patterns[pattern_id], copy_x, y - self.top)
+        self.surface = None
+
+    def prepare(self):
+        self.strip.set_palette_at(INK_INDEX, get_color(self.color))
+        if pygame.display.get_surface() is None:
+            self.surface = self.strip
+        else:
+            self.surface = self.strip.convert()
+            self.surface.set_colorkey(TRANSPARENT_KEY, pygame.RLEACCEL)
+
+    def reset(self, placements):
+        self.offset = 0.0
+        self.prev_offset = 0.0
+        self.layout(placements)
+
+    def update(self):
+        self.prev_offset = self.offset
+        self.offset += self.speed
+        if self.offset >= self.tile_width:
+            # Wrap both so interpolating between them never jumps backwards
+            self.offset -= self.tile_width
+            self.prev_offset -= self.tile_width
+
+    def get_shift(self, alpha=1.0):
+        return int(lerp(self.prev_offset, self.offset, alpha) % self.tile_width)
+
+    def draw(self, win, alpha=1.0):
+        version = get_color_version()
+        if version != self.color_version or self.surface is None:
+            self.color_version = version
+            self.prepare()
+
+        self.area.x = self.get_shift(alpha)
+        win.blit(self.surface, (0, self.top), self.area)
+
+    def get_draw_rects(self, alpha=1.0):
+        shift = self.get_shift(alpha)
+        rects = []
+        for pattern_id, x, y in self.placements:
+            pattern = self.patterns[pattern_id]
+            width = len(pattern[0]) * BLOCK_SIZE
+            height = len(pattern) * BLOCK_SIZE
+            screen_x = (x - shift) % self.tile_width
+            if screen_x < WIDTH:
+                rects.append(pygame.Rect(screen_x, y, width, height))
+            if screen_x + width > self.tile_width:
+                rects.append(pygame.Rect(screen_x - self.tile_width, y, width, height))
+        return rects
+
+    def get_state(self):
+        return (self.offset, self.prev_offset, self.placements)
+
+    def set_state(self, state):
+        self.offset, self.prev_offset, placements = state
+        if placements != self.placements:
+            self.layout(placements)
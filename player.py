@@ -1,14 +1,46 @@
 import pygame
 import random
-from constants import GROUND_Y, BLOCK_SIZE, DINO_FRAMES, DINO, SHIELD_PATTERNS, get_color
-from utils import draw_pixel_art
+from constants import GROUND_Y, BLOCK_SIZE, DINO_FRAMES, DINO, SHIELD_PATTERNS
+from constants import INPUT_JUMP, INPUT_SHIELD, INPUT_DASH
+from utils import draw_pixel_art, lerp
+from collision_masks import DINO_MASKS, DINO_FRAME_MASKS
 
 
 class Player:
-    def __init__(self, upgrades, settings_system=None):
-        self.settings_system = settings_system
+    __slots__ = (
+        "rng", "x", "y", "prev_x", "prev_y", "vel_y",
+        "base_gravity", "base_jump_force", "gravity", "jump_force",
+        "air_jump_used", "air_dash_used", "dash_velocity", "dash_duration", "dash_cooldown",
+        "max_dash_cooldown", "returning_to_start", "start_x",
+        "on_ground", "anim_frame", "anim_timer",
+        "max_health", "current_health", "invulnerable_timer",
+        "shield_active", "shield_duration", "shield_cooldown",
+        "max_shield_duration", "max_shield_cooldown",
+        "rect"
+    )
+
+    # Everything that changes during a run; the rest is derived from the upgrades
+    STATE_FIELDS = (
+        "x", "y", "prev_x", "prev_y", "vel_y",
+        "air_jump_used", "air_dash_used", "dash_velocity", "dash_duration", "dash_cooldown",
+        "returning_to_start", "on_ground", "anim_frame", "anim_timer",
+        "current_health", "invulnerable_timer",
+        "shield_active", "shield_duration", "shield_cooldown"
+    )
+
+    def __init__(self, upgrades, rng=random):
+        self.rng = rng
+        # Kept up to date in place instead of rebuilt on every collision check
+        width = len(DINO_FRAMES[0][0]) * BLOCK_SIZE
+        height = len(DINO_FRAMES[0]) * BLOCK_SIZE
+        self.rect = pygame.Rect(0, 0, width, height)
+        self.reset(upgrades)
+
+    def reset(self, upgrades):
         self.x = 100
         self.y = GROUND_Y - len(DINO_FRAMES[0]) * BLOCK_SIZE
+        self.prev_x = self.x
+        self.prev_y = self.y
         self.vel_y = 0
         
         self.base_gravity = 0.8
@@ -31,12 +63,6 @@ class Player:
         self.anim_frame = 0
         self.anim_timer = 0
         
-        self.prev_space = False
-        self.prev_s = False
-        self.prev_d = False
-        
-        self.prev_keys = {}
-        
         self.max_health = 1 + upgrades["bonus_health"]
         self.current_health = self.max_health
         self.invulnerable_timer = 0
@@ -52,37 +78,21 @@ class Player:
         self.max_shield_duration = base_duration + (shield_level * 30)
         self.max_shield_cooldown = base_cooldown - (shield_level * 150)
         self.max_shield_cooldown = max(600, self.max_shield_cooldown)
+        
+        self.update_rects()
 
-    def get_keybind(self, action):
-        if self.settings_system:
-            return self.settings_system.get_keybind(action)
-        else:
-            defaults = {
-                "jump": pygame.K_SPACE,
-                "shield": pygame.K_s,
-                "dash": pygame.K_d
-            }
-            return defaults.get(action, pygame.K_UNKNOWN)
+    def get_state(self):
+        return tuple(getattr(self, field) for field in self.STATE_FIELDS)
 
-    def is_key_pressed(self, keys, action):
-        key = self.get_keybind(action)
-        if key == pygame.K_UNKNOWN:
-            return False
-        
-        current_pressed = keys[key]
-        prev_pressed = self.prev_keys.get(key, False)
-        
-        return current_pressed and not prev_pressed
+    def set_state(self, state):
+        for field, value in zip(self.STATE_FIELDS, state):
+            setattr(self, field, value)
+        self.update_rects()
 
-    def handle_input(self, keys, upgrades):
-        if self.settings_system:
-            jump_pressed = self.is_key_pressed(keys, "jump")
-            shield_pressed = self.is_key_pressed(keys, "shield")
-            dash_pressed = self.is_key_pressed(keys, "dash")
-        else:
-            jump_pressed = keys[pygame.K_SPACE] and not self.prev_space
-            shield_pressed = keys[pygame.K_s] and not self.prev_s
-            dash_pressed = keys[pygame.K_d] and not self.prev_d
+    def handle_input(self, pressed, upgrades):
+        jump_pressed = pressed & INPUT_JUMP
+        shield_pressed = pressed & INPUT_SHIELD
+        dash_pressed = pressed & INPUT_DASH
         
         if jump_pressed and self.on_ground:
             self.jump()
@@ -99,16 +109,6 @@ class Player:
             not self.air_dash_used and upgrades["air_dash"] > 0 and
             self.dash_cooldown == 0):
             self.air_dash(upgrades)
-        
-        if self.settings_system:
-            for action in ["jump", "shield", "dash"]:
-                key = self.get_keybind(action)
-                if key != pygame.K_UNKNOWN:
-                    self.prev_keys[key] = keys[key]
-        else:
-            self.prev_space = keys[pygame.K_SPACE]
-            self.prev_s = keys[pygame.K_s]
-            self.prev_d = keys[pygame.K_d]
 
     def jump(self):
         self.vel_y = self.jump_force
@@ -154,7 +154,7 @@ class Player:
         dodge_level = upgrades["dodge_chance"]
         dodge_chance = dodge_level * 5
         
-        if random.randint(1, 100) <= dodge_chance:
+        if self.rng.randint(1, 100) <= dodge_chance:
             return False
             
         self.current_health -= 1
@@ -162,10 +162,11 @@ class Player:
         
         return self.current_health <= 0
 
-    def update(self, upgrades, obstacle_speed=6):
-        keys = pygame.key.get_pressed()
+    def update(self, upgrades, obstacle_speed=6, pressed=0):
+        self.prev_x = self.x
+        self.prev_y = self.y
         
-        self.handle_input(keys, upgrades)
+        self.handle_input(pressed, upgrades)
         
         self.update_shield()
         self.update_invulnerability()
@@ -174,6 +175,12 @@ class Player:
         
         self.update_physics()
         self.update_animation()
+        self.update_rects()
+
+    def update_rects(self):
+        # Truncate like the Rect constructor does; assigning a float attribute would round
+        self.rect.x = int(self.x)
+        self.rect.y = int(self.y)
 
     def update_shield(self):
         if self.shield_duration > 0:
@@ -245,16 +252,20 @@ class Player:
                 self.anim_frame = (self.anim_frame + 1) % len(DINO_FRAMES)
 
     def get_rect(self):
+        return self.rect
+
+    def get_draw_rect(self, alpha=1.0):
         width = len(DINO_FRAMES[0][0]) * BLOCK_SIZE
         height = len(DINO_FRAMES[0]) * BLOCK_SIZE
-        return pygame.Rect(self.x, self.y, width, height)
+        return pygame.Rect(lerp(self.prev_x, self.x, alpha), lerp(self.prev_y, self.y, alpha), width, height)
 
-    def get_collision_rect(self):
-        rect = self.get_rect()
-        rect.inflate_ip(-8, -8)
-        return rect
+    def get_mask(self):
+        # Matches the frame draw() shows
+        if self.returning_to_start:
+            return DINO_MASKS[0]
+        return DINO_FRAME_MASKS[self.anim_frame]
 
-    def draw(self, win):
+    def draw(self, win, alpha=1.0):
         if self.invulnerable_timer > 0 and self.invulnerable_timer % 10 < 5:
             return
         
@@ -264,14 +275,17 @@ class Player:
         else:
             dino_frame = DINO_FRAMES[self.anim_frame]
             
+        x = lerp(self.prev_x, self.x, alpha)
+        y = lerp(self.prev_y, self.y, alpha)
+        
         if self.is_dashing():
-            draw_pixel_art(win, dino_frame, self.x, self.y, get_color("DARK_GRAY"))
+            draw_pixel_art(win, dino_frame, x, y, "DARK_GRAY")
         else:
-            draw_pixel_art(win, dino_frame, self.x, self.y, get_color("VERY_DARK"))
+            draw_pixel_art(win, dino_frame, x, y, "VERY_DARK")
         
         if self.shield_active:
             shield_stage = self.get_shield_stage()
             if shield_stage >= 0:
-                shield_x = self.x + 8
-                shield_y = self.y + 15
-                draw_pixel_art(win, SHIELD_PATTERNS[shield_stage], shield_x, shield_y, get_color("DARK_GRAY"))
\ No newline at end of file
+                shield_x = x + 8
+                shield_y = y + 15
+                draw_pixel_art(win, SHIELD_PATTERNS[shield_stage], shield_x, shield_y, "DARK_GRAY")
\ No newline at end of file
@@ -0,0 +1,188 @@
+import argparse
+import json
+import time
+from constants import REPLAY_FILE, TICK_RATE
+from simulation import Simulation, RULES_VERSION
+
+REPLAY_VERSION = 1
+# One keyframe every 10 seconds of play keeps any seek under 600 re-simulated ticks
+KEYFRAME_INTERVAL = TICK_RATE * 10
+
+
+class Replay:
+    def __init__(self, seed, upgrades, inputs, ticks=0, score=0, coins=0):
+        self.seed = seed
+        self.upgrades = upgrades
+        # Sparse list of [tick, pressed bits]; ticks without a key press are omitted
+        self.inputs = inputs
+        self.ticks = ticks
+        self.score = score
+        self.coins = coins
+
+    def get_input_schedule(self):
+        return {tick: pressed for tick, pressed in self.inputs}
+
+    def to_dict(self):
+        return {
+            "version": REPLAY_VERSION,
+            "rules": RULES_VERSION,
+            "seed": self.seed,
+            "upgrades": self.upgrades,
+            "inputs": self.inputs,
+            "ticks": self.ticks,
+            "score": self.score,
+            "coins": self.coins
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        if data.get("version") != REPLAY_VERSION:
+            raise ValueError(f"Unsupported replay version: {data.get('version')}")
+        if data.get("rules", 1) != RULES_VERSION:
+            raise ValueError(f"Replay was recorded with gameplay rules {data.get('rules', 1)}, not {RULES_VERSION}")
+        return cls(
+            data["seed"],
+            data["upgrades"],
+            [list(entry) for entry in data["inputs"]],
+            data["ticks"],
+            data["score"],
+            data["coins"]
+        )
+
+    def save(self, path=REPLAY_FILE):
+        try:
+            with open(path, 'w') as f:
+                json.dump(self.to_dict(), f, separators=(",", ":"))
+        except Exception as e:
+            print(f"Error saving replay: {e}")
+
+    @classmethod
+    def load(cls, path=REPLAY_FILE):
+        with open(path, 'r') as f:
+            return cls.from_dict(json.load(f))
+
+
+class ReplayRecorder:
+    def __init__(self, seed, upgrades):
+        self.seed = seed
+        self.upgrades = dict(upgrades)
+        self.inputs = []
+        self.tick = 0
+
+    def record(self, pressed):
+        if pressed:
+            self.inputs.append([self.tick, pressed])
+        self.tick += 1
+
+    def finish(self, simulation):
+        return Replay(
+            self.seed,
+            self.upgrades,
+            self.inputs,
+            simulation.tick,
+            simulation.score,
+            simulation.coins_this_run
+        )
+
+
+class ReplayPlayer:
+    def __init__(self, replay, keyframe_interval=KEYFRAME_INTERVAL, background=None):
+        self.replay = replay
+        self.keyframe_interval = keyframe_interval
+        self.background = background
+        self.schedule = replay.get_input_schedule()
+        self.simulation = Simulation(dict(replay.upgrades), replay.seed)
+        if self.background is not None:
+            self.background.reset(self.simulation.create_cosmetic_rng())
+        self.keyframes = {}
+        self.build_keyframes()
+
+    @property
+    def tick(self):
+        return self.simulation.tick
+
+    def build_keyframes(self):
+        # One headless pass over the whole replay up front, so a seek anywhere, even past
+        # what has been watched, never re-simulates more than one interval
+        self.capture_keyframe()
+        while self.step():
+            if self.simulation.tick % self.keyframe_interval == 0:
+                self.capture_keyframe()
+        self.restore_keyframe(0)
+
+    def capture_keyframe(self):
+        background_state = self.background.get_state() if self.background is not None else None
+        self.keyframes[self.simulation.tick] = (self.simulation.snapshot(), background_state)
+
+    def restore_keyframe(self, tick):
+        simulation_state, background_state = self.keyframes[tick]
+        self.simulation.restore(simulation_state)
+        if self.background is not None:
+            self.background.set_state(background_state)
+
+    def is_finished(self):
+        return self.simulation.game_over or self.simulation.tick >= self.replay.ticks
+
+    def step(self):
+        if self.is_finished():
+            return False
+        if self.background is not None:
+            self.background.update()
+        self.simulation.step(self.schedule.get(self.simulation.tick, 0))
+        return True
+
+    def advance(self, ticks):
+        for i in range(ticks):
+            if not self.step():
+                break
+
+    def seek(self, tick):
+        tick = max(0, min(tick, self.replay.ticks))
+        # Jump to the latest keyframe at or before the target, then play forward from it
+        keyframe_tick = max(t for t in self.keyframes if t <= tick)
+        if not (keyframe_tick <= self.simulation.tick <= tick):
+            self.restore_keyframe(keyframe_tick)
+        self.advance(tick - self.simulation.tick)
+
+
+def simulate_replay(replay, max_ticks=None):
+    simulation = Simulation(dict(replay.upgrades), replay.seed)
+    schedule = replay.get_input_schedule()
+    max_ticks = replay.ticks if max_ticks is None else max_ticks
+
+    while simulation.tick < max_ticks and not simulation.game_over:
+        simulation.step(schedule.get(simulation.tick, 0))
+    return simulation
+
+
+def verify_replay(replay):
+    simulation = simulate_replay(replay)
+    return (
+        simulation.game_over and
+        simulation.tick == replay.ticks and
+        simulation.score == replay.score and
+        simulation.coins_this_run == replay.coins
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Verify a recorded Rogue Dino run")
+    parser.add_argument("path", nargs="?", default=REPLAY_FILE)
+    args = parser.parse_args()
+
+    replay = Replay.load(args.path)
+
+    start = time.perf_counter()
+    valid = verify_replay(replay)
+    elapsed = time.perf_counter() - start
+
+    real_time = replay.ticks / TICK_RATE
+    speedup = real_time / elapsed if elapsed > 0 else float("inf")
+    print(f"Score {replay.score} over {replay.ticks} ticks, seed {replay.seed}")
+    print(f"Re-simulated in {elapsed:.3f}s ({speedup:.0f}x real time)")
+    print("VALID" if valid else "MISMATCH")
+    return 0 if valid else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
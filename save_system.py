@@ -1,6 +1,7 @@
 import json
 import os
-from constants import SAVE_FILE
+from constants import SAVE_FILE, UPGRADE_NAMES
+from simulation import get_score_multiplier
 import pygame
 import random
 
@@ -9,21 +10,7 @@ class SaveSystem:
         self.data = {
             "coins": 0,
             "high_score": 0,
-            "upgrades": {
-                "jump_boost": 0,
-                "coin_multiplier": 0,
-                "speed_boost": 0,
-                "shield": 0,
-                "slow_motion": 0,
-                "shield_upgrade": 0,
-                "slow_acceleration": 0,
-                "air_jump": 0,
-                "air_dash": 0,
-                "dash_distance": 0,
-                "dodge_chance": 0,
-                "bonus_health": 0,
-                "score_multiplier": 0
-            }
+            "upgrades": {name: 0 for name in UPGRADE_NAMES}
         }
         self.load_save()
 
@@ -67,6 +54,4 @@ class SaveSystem:
             self.data["upgrades"][upgrade_name] += 1
 
     def get_score_multiplier(self):
-        level = self.data["upgrades"]["score_multiplier"]
-        multipliers = [1, 10, 100, 1000]
-        return multipliers[min(level, len(multipliers) - 1)]
\ No newline at end of file
+        return get_score_multiplier(self.data["upgrades"])
\ No newline at end of file
@@ -1,18 +1,23 @@
 import pygame
 from constants import WIDTH, HEIGHT
+from font_registry import get_font
+from text_cache import render_text
 
 class SettingsMenu:
     def __init__(self, settings_system, color_manager):
         self.settings_system = settings_system
         self.color_manager = color_manager
         
-        self.title_font = pygame.font.Font(None, 48)
-        self.font = pygame.font.Font(None, 32)
-        self.small_font = pygame.font.Font(None, 24)
+        self.title_font = get_font(48)
+        self.font = get_font(32)
+        self.small_font = get_font(24)
+        self.tiny_font = get_font(20)
         
         self.menu_items = [
             "resolution",
             "fullscreen",
+            "partial_redraw",
+            "frame_limit",
             "color_scheme",
             "keybind_jump",
             "keybind_shield",
@@ -86,7 +91,7 @@ class SettingsMenu:
             return "menu"
         elif action in ["color1", "color2", "color3"]:
             scheme_num = int(action[-1])
-            self.settings_system.change_color_scheme(scheme_num)
+            self.color_manager.set_color_scheme(scheme_num)
             self.settings_system.save_settings()
         
         return None
@@ -97,6 +102,9 @@ class SettingsMenu:
             if self.settings_system.change_resolution(1):
                 self.settings_system.save_settings()
                 return "apply_resolution"
+        elif current_item == "frame_limit":
+            if self.settings_system.change_frame_limit(1):
+                self.settings_system.save_settings()
         return None
     
     def handle_decrease(self):
@@ -105,6 +113,9 @@ class SettingsMenu:
             if self.settings_system.change_resolution(-1):
                 self.settings_system.save_settings()
                 return "apply_resolution"
+        elif current_item == "frame_limit":
+            if self.settings_system.change_frame_limit(-1):
+                self.settings_system.save_settings()
         return None
     
     def handle_select(self):
@@ -117,6 +128,9 @@ class SettingsMenu:
             self.settings_system.toggle_fullscreen()
             self.settings_system.save_settings()
             return "apply_fullscreen"
+        elif current_item == "partial_redraw":
+            self.settings_system.toggle_dirty_rects()
+            self.settings_system.save_settings()
         elif current_item.startswith("keybind_"):
             self.waiting_for_key = current_item
         elif current_item == "back":
@@ -130,7 +144,7 @@ class SettingsMenu:
         win.fill(colors["UI_BACKGROUND"])
         
         title_y = max(60, HEIGHT // 8)
-        title_text = self.title_font.render("SETTINGS", True, colors["UI_TEXT"])
+        title_text = render_text(self.title_font, "SETTINGS", True, colors["UI_TEXT"])
         title_rect = title_text.get_rect(center=(WIDTH//2, title_y))
         win.blit(title_text, title_rect)
         
@@ -141,10 +155,10 @@ class SettingsMenu:
             instruction = "Arrow/WASD: Navigate • +/-: Change • X: Fullscreen • 1-3: Colors • Mouse Wheel: Scroll"
             color = colors["GRAY"]
         
-        inst_text = self.small_font.render(instruction, True, color)
+        inst_text = render_text(self.small_font, instruction, True, color)
         
         if inst_text.get_width() > WIDTH - 40:
-            inst_text = self.tiny_font.render(instruction, True, color)
+            inst_text = render_text(self.tiny_font, instruction, True, color)
         
         inst_rect = inst_text.get_rect(center=(WIDTH//2, HEIGHT - 30))
         win.blit(inst_text, inst_rect)
@@ -179,16 +193,16 @@ class SettingsMenu:
             label_color = colors["UI_TEXT"]
             value_color = colors["GRAY"]
         
-        label_text = self.font.render(label, True, label_color)
-        value_text = self.font.render(value, True, value_color)
+        label_text = render_text(self.font, label, True, label_color)
+        value_text = render_text(self.font, value, True, value_color)
         
         max_label_width = bg_width // 2 - 20
         max_value_width = bg_width // 2 - 20
         
         if label_text.get_width() > max_label_width:
-            label_text = self.small_font.render(label, True, label_color)
+            label_text = render_text(self.small_font, label, True, label_color)
         if value_text.get_width() > max_value_width:
-            value_text = self.small_font.render(value, True, value_color)
+            value_text = render_text(self.small_font, value, True, value_color)
         
         win.blit(label_text, (bg_x + 20, y))
         
@@ -207,6 +221,14 @@ class SettingsMenu:
             value = "ON" if self.settings_system.data["fullscreen"] else "OFF"
             return "Fullscreen", value
         
+        elif item == "partial_redraw":
+            value = "ON" if self.settings_system.data["dirty_rects"] else "OFF"
+            return "Partial Redraw", value
+        
+        elif item == "frame_limit":
+            limit = self.settings_system.data["frame_limit"]
+            return "Frame Limit", f"{limit} FPS" if limit else "Uncapped"
+        
         elif item == "color_scheme":
             return "Color Scheme", self.settings_system.get_color_scheme_name()
         
@@ -2,6 +2,26 @@ import json
 import os
 import pygame
 
+KEY_NAMES = {
+    pygame.K_SPACE: "SPACE",
+    pygame.K_RETURN: "ENTER",
+    pygame.K_ESCAPE: "ESC",
+    pygame.K_LSHIFT: "L-SHIFT",
+    pygame.K_RSHIFT: "R-SHIFT",
+    pygame.K_LCTRL: "L-CTRL",
+    pygame.K_RCTRL: "R-CTRL",
+    pygame.K_LALT: "L-ALT",
+    pygame.K_RALT: "R-ALT",
+    pygame.K_UP: "UP",
+    pygame.K_DOWN: "DOWN",
+    pygame.K_LEFT: "LEFT",
+    pygame.K_RIGHT: "RIGHT",
+    pygame.K_TAB: "TAB",
+    pygame.K_BACKSPACE: "BACKSPACE",
+    pygame.K_DELETE: "DELETE"
+}
+
+
 class SettingsSystem:
     def __init__(self):
         self.settings_file = "dino_settings.json"
@@ -10,6 +30,8 @@ class SettingsSystem:
             "resolution_scale": 1.0,  
             "fullscreen": False,
             "color_scheme": 1,  # 1=normal, 2=old paper, 3=inverted
+            "dirty_rects": True,  # only present the regions that changed
+            "frame_limit": 60,  # render rate cap, 0 = uncapped
             "keybinds": {
                 "jump": pygame.K_SPACE,
                 "shield": pygame.K_s,
@@ -22,6 +44,9 @@ class SettingsSystem:
         self.resolution_options = [0.5, 0.75, 1.0, 1.25, 1.5, 2.0, 2.5, 3.0]
         self.current_resolution_index = 2  
         
+        self.frame_limit_options = [30, 60, 120, 144, 240, 0]
+        self.current_frame_limit_index = 1
+        
         self.load_settings()
     
     def load_settings(self):
@@ -33,6 +58,9 @@ class SettingsSystem:
                     
                     if self.data["resolution_scale"] in self.resolution_options:
                         self.current_resolution_index = self.resolution_options.index(self.data["resolution_scale"])
+                    
+                    if self.data["frame_limit"] in self.frame_limit_options:
+                        self.current_frame_limit_index = self.frame_limit_options.index(self.data["frame_limit"])
             except Exception as e:
                 print(f"Error loading settings: {e}")
     
@@ -58,10 +86,24 @@ class SettingsSystem:
             return True
         return False
     
+    def change_frame_limit(self, direction):
+        old_index = self.current_frame_limit_index
+        self.current_frame_limit_index += direction
+        self.current_frame_limit_index = max(0, min(len(self.frame_limit_options) - 1, self.current_frame_limit_index))
+        
+        if self.current_frame_limit_index != old_index:
+            self.data["frame_limit"] = self.frame_limit_options[self.current_frame_limit_index]
+            return True
+        return False
+    
     def toggle_fullscreen(self):
         self.data["fullscreen"] = not self.data["fullscreen"]
         return self.data["fullscreen"]
     
+    def toggle_dirty_rects(self):
+        self.data["dirty_rects"] = not self.data["dirty_rects"]
+        return self.data["dirty_rects"]
+    
     def change_color_scheme(self, scheme):
         if 1 <= scheme <= 3:
             self.data["color_scheme"] = scheme
@@ -78,27 +120,8 @@ class SettingsSystem:
         return self.data["keybinds"].get(action, pygame.K_UNKNOWN)
     
     def get_key_name(self, key):
-        key_names = {
-            pygame.K_SPACE: "SPACE",
-            pygame.K_RETURN: "ENTER",
-            pygame.K_ESCAPE: "ESC",
-            pygame.K_LSHIFT: "L-SHIFT",
-            pygame.K_RSHIFT: "R-SHIFT",
-            pygame.K_LCTRL: "L-CTRL",
-            pygame.K_RCTRL: "R-CTRL",
-            pygame.K_LALT: "L-ALT",
-            pygame.K_RALT: "R-ALT",
-            pygame.K_UP: "UP",
-            pygame.K_DOWN: "DOWN",
-            pygame.K_LEFT: "LEFT",
-            pygame.K_RIGHT: "RIGHT",
-            pygame.K_TAB: "TAB",
-            pygame.K_BACKSPACE: "BACKSPACE",
-            pygame.K_DELETE: "DELETE"
-        }
-        
-        if key in key_names:
-            return key_names[key]
+        if key in KEY_NAMES:
+            return KEY_NAMES[key]
         elif 97 <= key <= 122:  # a-z
             return chr(key).upper()
         elif 48 <= key <= 57:  # 0-9
@@ -1,6 +1,8 @@
 import pygame
 import math
 from constants import get_colors
+from font_registry import get_font
+from text_cache import render_text
 
 
 class ShopItem:
@@ -42,107 +44,111 @@ class ShopItem:
         return current_level >= self.max_level
 
 
+def create_shop_items():
+    return {
+        "jump_boost": ShopItem(
+            "Jump Boost", 
+            "Higher jumps for better obstacle clearing", 
+            10, 
+            [0, 1000, 2000, 5000, 10000],
+            5
+        ),
+        "coin_multiplier": ShopItem(
+            "Coin Multiplier", 
+            "Extra coins per obstacle passed", 
+            25, 
+            [500, 2000, 5000, 15000, 35000, 70000, 120000, 180000, 250000],
+            9
+        ),
+        "speed_boost": ShopItem(
+            "Speed Boost", 
+            "Faster movement and higher scores", 
+            20, 
+            [1000, 3000, 7000],
+            3
+        ),
+        "shield": ShopItem(
+            "Shield", 
+            "Press S for temporary protection", 
+            50, 
+            [5000],
+            1
+        ),
+        "slow_motion": ShopItem(
+            "Slow Motion", 
+            "Slower obstacles, easier timing", 
+            75, 
+            [10000, 15000, 25000, 40000],
+            4
+        ),
+        "shield_upgrade": ShopItem(
+            "Shield Enhance", 
+            "Better shield duration and cooldown", 
+            100, 
+            [15000, 20000, 30000, 50000, 75000, 100000],
+            6
+        ),
+        "slow_acceleration": ShopItem(
+            "Steady Pace", 
+            "Slower game speed increase", 
+            80, 
+            [20000, 35000, 60000, 100000],
+            4
+        ),
+        "score_multiplier": ShopItem(
+            "Score Multiplier", 
+            "10x/100x/1000x points per obstacle!", 
+            500, 
+            [25000, 250000, 2500000],
+            3
+        ),
+        "air_jump": ShopItem(
+            "Air Jump", 
+            "Small jump while airborne", 
+            120, 
+            [50000],
+            1
+        ),
+        "air_dash": ShopItem(
+            "Air Dash", 
+            "Press D to dash horizontally in air", 
+            150, 
+            [100000],
+            1
+        ),
+        "dash_distance": ShopItem(
+            "Dash Distance", 
+            "Longer air dash distance", 
+            200, 
+            [150000, 300000, 500000],
+            3
+        ),
+        "dodge_chance": ShopItem(
+            "Lucky Dodge", 
+            "Chance to survive cactus collision", 
+            300, 
+            [200000, 400000, 800000, 1600000, 3200000],
+            5
+        ),
+        "bonus_health": ShopItem(
+            "Extra Life", 
+            "Survive one extra hit", 
+            500, 
+            [500000, 5000000],
+            2
+        )
+    }
+
+
 class Shop:
     def __init__(self, save_system):
         self.save_system = save_system
-        self.title_font = pygame.font.Font(None, 48)
-        self.font = pygame.font.Font(None, 32)
-        self.small_font = pygame.font.Font(None, 24)
-        self.tiny_font = pygame.font.Font(None, 20)
-        
-        self.items = {
-            "jump_boost": ShopItem(
-                "Jump Boost", 
-                "Higher jumps for better obstacle clearing", 
-                10, 
-                [0, 1000, 2000, 5000, 10000],
-                5
-            ),
-            "coin_multiplier": ShopItem(
-                "Coin Multiplier", 
-                "Extra coins per obstacle passed", 
-                25, 
-                [500, 2000, 5000, 15000, 35000, 70000, 120000, 180000, 250000],
-                9
-            ),
-            "speed_boost": ShopItem(
-                "Speed Boost", 
-                "Faster movement and higher scores", 
-                20, 
-                [1000, 3000, 7000],
-                3
-            ),
-            "shield": ShopItem(
-                "Shield", 
-                "Press S for temporary protection", 
-                50, 
-                [5000],
-                1
-            ),
-            "slow_motion": ShopItem(
-                "Slow Motion", 
-                "Slower obstacles, easier timing", 
-                75, 
-                [10000, 15000, 25000, 40000],
-                4
-            ),
-            "shield_upgrade": ShopItem(
-                "Shield Enhance", 
-                "Better shield duration and cooldown", 
-                100, 
-                [15000, 20000, 30000, 50000, 75000, 100000],
-                6
-            ),
-            "slow_acceleration": ShopItem(
-                "Steady Pace", 
-                "Slower game speed increase", 
-                80, 
-                [20000, 35000, 60000, 100000],
-                4
-            ),
-            "score_multiplier": ShopItem(
-                "Score Multiplier", 
-                "10x/100x/1000x points per obstacle!", 
-                500, 
-                [25000, 250000, 2500000],
-                3
-            ),
-            "air_jump": ShopItem(
-                "Air Jump", 
-                "Small jump while airborne", 
-                120, 
-                [50000],
-                1
-            ),
-            "air_dash": ShopItem(
-                "Air Dash", 
-                "Press D to dash horizontally in air", 
-                150, 
-                [100000],
-                1
-            ),
-            "dash_distance": ShopItem(
-                "Dash Distance", 
-                "Longer air dash distance", 
-                200, 
-                [150000, 300000, 500000],
-                3
-            ),
-            "dodge_chance": ShopItem(
-                "Lucky Dodge", 
-                "Chance to survive cactus collision", 
-                300, 
-                [200000, 400000, 800000, 1600000, 3200000],
-                5
-            ),
-            "bonus_health": ShopItem(
-                "Extra Life", 
-                "Survive one extra hit", 
-                500, 
-                [500000, 5000000],
-                2
-            )
-        }
+        self.title_font = get_font(48)
+        self.font = get_font(32)
+        self.small_font = get_font(24)
+        self.tiny_font = get_font(20)
+        
+        self.items = create_shop_items()
         
         self.cols = 2
         self.items_per_tab = 4
@@ -151,7 +157,7 @@ class Shop:
         self.selected_col = 0
         self.tab_transition_offset = 0
         self.transitioning = False
-        self.transition_speed = 15
+        self.transition_speed = 30
         
         self.item_list = list(self.items.items())
         self.total_tabs = math.ceil(len(self.item_list) / self.items_per_tab)
@@ -330,16 +336,16 @@ class Shop:
         pygame.draw.rect(win, border_color, (x, y, width, height), 3 if is_selected else 2)
         
         name_color = colors["GRAY"] if not next_level_unlocked and not is_maxed else colors["UI_TEXT"]
-        name_text = self.font.render(item.name, True, name_color)
+        name_text = render_text(self.font, item.name, True, name_color)
         win.blit(name_text, (x + 15, y + 10))
         
         level_text = f"Level {current_level}/{item.max_level}"
         level_color = colors["DARK_GRAY"] if is_maxed else colors["UI_ACCENT"]
-        level_surface = self.small_font.render(level_text, True, level_color)
+        level_surface = render_text(self.small_font, level_text, True, level_color)
         win.blit(level_surface, (x + 15, y + 35))
         
         desc_color = colors["GRAY"] if not next_level_unlocked and not is_maxed else colors["UI_TEXT"]
-        desc_surface = self.tiny_font.render(item.description, True, desc_color)
+        desc_surface = render_text(self.tiny_font, item.description, True, desc_color)
         win.blit(desc_surface, (x + 15, y + 60))
         
         if is_maxed:
@@ -358,12 +364,12 @@ class Shop:
             status_text = f"Cost: {self.format_number(cost)} coins"
             status_color = colors["UI_ACCENT"] if can_afford else colors["GRAY"]
         
-        status_surface = self.small_font.render(status_text, True, status_color)
+        status_surface = render_text(self.small_font, status_text, True, status_color)
         win.blit(status_surface, (x + 15, y + 80))
         
         if is_selected and next_level_unlocked and not is_maxed and can_afford:
             hint_text = "[SPACE] to purchase"
-            hint_surface = self.tiny_font.render(hint_text, True, colors["UI_ACCENT"])
+            hint_surface = render_text(self.tiny_font, hint_text, True, colors["UI_ACCENT"])
             hint_x = x + width - hint_surface.get_width() - 10
             hint_y = y + height - hint_surface.get_height() - 5
             win.blit(hint_surface, (hint_x, hint_y))
@@ -372,7 +378,7 @@ class Shop:
             multiplier_values = [10, 100, 1000]
             if current_level <= len(multiplier_values):
                 mult_text = f"{multiplier_values[current_level-1]}x Score!"
-                mult_surface = self.tiny_font.render(mult_text, True, colors["DARK_GRAY"])
+                mult_surface = render_text(self.tiny_font, mult_text, True, colors["DARK_GRAY"])
                 mult_x = x + width - mult_surface.get_width() - 10
                 mult_y = y + 15
                 win.blit(mult_surface, (mult_x, mult_y))
@@ -399,8 +405,6 @@ class Shop:
             self.draw_card(win, x, y, card_width, card_height, upgrade_name, item, current_level, is_selected)
 
     def draw(self, win):
-        self.update()
-        
         colors = get_colors()
         
         win.fill(colors["UI_BACKGROUND"])
@@ -409,35 +413,35 @@ class Shop:
         pygame.draw.rect(win, colors["WHITE"], (0, 0, 800, header_height))
         pygame.draw.line(win, colors["UI_BORDER"], (0, header_height), (800, header_height), 2)
         
-        title = self.title_font.render("UPGRADE SHOP", True, colors["UI_TEXT"])
+        title = render_text(self.title_font, "UPGRADE SHOP", True, colors["UI_TEXT"])
         win.blit(title, (50, 25))
         
         coins_text = f"Coins: {self.format_number(self.save_system.data['coins'])}"
         score_text = f"High Score: {self.format_number(self.save_system.data['high_score'])}"
         
-        coins_surface = self.font.render(coins_text, True, colors["UI_ACCENT"])
-        score_surface = self.small_font.render(score_text, True, colors["UI_TEXT"])
+        coins_surface = render_text(self.font, coins_text, True, colors["UI_ACCENT"])
+        score_surface = render_text(self.small_font, score_text, True, colors["UI_TEXT"])
         
         max_text_width = 250
         if coins_surface.get_width() > max_text_width:
-            coins_surface = self.small_font.render(coins_text, True, colors["UI_ACCENT"])
+            coins_surface = render_text(self.small_font, coins_text, True, colors["UI_ACCENT"])
         if score_surface.get_width() > max_text_width:
-            score_surface = self.tiny_font.render(score_text, True, colors["UI_TEXT"])
+            score_surface = render_text(self.tiny_font, score_text, True, colors["UI_TEXT"])
         
         win.blit(coins_surface, (800 - coins_surface.get_width() - 50, 25))
         win.blit(score_surface, (800 - score_surface.get_width() - 50, 55))
         
         if self.total_tabs > 1:
             tab_text = f"Tab {self.current_tab + 1} of {self.total_tabs}"
-            tab_surface = self.small_font.render(tab_text, True, colors["GRAY"])
+            tab_surface = render_text(self.small_font, tab_text, True, colors["GRAY"])
             tab_x = 400 - tab_surface.get_width() // 2
             win.blit(tab_surface, (tab_x, 65))
         
         instructions = "Arrow Keys Navigate • SPACE Purchase • M/ESC Menu • Mouse Wheel Scroll"
-        inst_surface = self.small_font.render(instructions, True, colors["GRAY"])
+        inst_surface = render_text(self.small_font, instructions, True, colors["GRAY"])
         
         if inst_surface.get_width() > 700:
-            inst_surface = self.tiny_font.render(instructions, True, colors["GRAY"])
+            inst_surface = render_text(self.tiny_font, instructions, True, colors["GRAY"])
         
         win.blit(inst_surface, (50, 85))
         
@@ -0,0 +1,95 @@
+import random
+from constants import SCORE_MULTIPLIERS
+from obstacle import ObstacleManager
+from player import Player
+
+# Bumped whenever a rule change makes the same seed and inputs play out differently,
+# which invalidates saved replays and cached balance results
+RULES_VERSION = 2
+
+
+def get_score_multiplier(upgrades):
+    level = upgrades["score_multiplier"]
+    return SCORE_MULTIPLIERS[min(level, len(SCORE_MULTIPLIERS) - 1)]
+
+
+def new_seed():
+    return random.randrange(2 ** 32)
+
+
+class Simulation:
+    def __init__(self, upgrades, seed=None):
+        # Gameplay randomness has its own stream so cosmetics can never desync a replay.
+        # The stream and the entities are built once; every run reseeds and resets them in place
+        self.rng = random.Random()
+        self.player = Player(upgrades, self.rng)
+        self.obstacle_manager = ObstacleManager(self.rng)
+        self.reset(new_seed() if seed is None else seed, upgrades)
+
+    def reset(self, seed=None, upgrades=None):
+        # Resetting without a seed replays the same run
+        if seed is not None:
+            self.seed = seed
+        
+        if upgrades is not None:
+            self.upgrades = upgrades
+            self.score_multiplier = get_score_multiplier(upgrades)
+        
+        self.rng.seed(self.seed)
+        self.player.reset(self.upgrades)
+        self.obstacle_manager.reset()
+        self.tick = 0
+        self.base_score = 0
+        self.score = 0
+        self.coins_this_run = 0
+        self.coins_earned = 0
+        self.game_over = False
+        self.cause_of_death = None
+
+    def snapshot(self):
+        return (
+            self.tick,
+            self.base_score,
+            self.score,
+            self.coins_this_run,
+            self.coins_earned,
+            self.game_over,
+            self.cause_of_death,
+            self.rng.getstate(),
+            self.player.get_state(),
+            self.obstacle_manager.get_state()
+        )
+
+    def restore(self, snapshot):
+        (self.tick, self.base_score, self.score, self.coins_this_run, self.coins_earned,
+         self.game_over, self.cause_of_death, rng_state, player_state, obstacle_state) = snapshot
+        self.rng.setstate(rng_state)
+        self.player.set_state(player_state)
+        self.obstacle_manager.set_state(obstacle_state)
+
+    def create_cosmetic_rng(self, rng=None):
+        if rng is None:
+            return random.Random(f"{self.seed}-cosmetic")
+        rng.seed(f"{self.seed}-cosmetic")
+        return rng
+
+    def step(self, pressed=0):
+        upgrades = self.upgrades
+        
+        self.obstacle_manager.update(upgrades)
+        
+        self.player.update(upgrades, self.obstacle_manager.current_speed, pressed)
+        
+        passed_obstacles = self.obstacle_manager.count_passed_obstacles()
+        self.coins_earned = passed_obstacles * (1 + upgrades["coin_multiplier"])
+        self.coins_this_run += self.coins_earned
+        
+        self.base_score += 1
+        self.score = self.base_score * self.score_multiplier
+        self.tick += 1
+        
+        if self.obstacle_manager.check_collisions(self.player, upgrades):
+            self.game_over = True
+            self.cause_of_death = "cactus"
+        
+        return self.game_over
@@ -0,0 +1,130 @@
+import sys
+import time
+import tracemalloc
+from stats import percentile
+from text_cache import get_text_cache
+
+LOG_FIELDS = (
+    "elapsed", "frames", "frame_ms_mean", "frame_ms_p99", "frame_ms_max",
+    "runs", "best_score", "game_time", "speed", "obstacles", "clouds", "mountains",
+    "text_hits", "text_misses", "text_cached", "heap_blocks", "traced_kb", "traced_peak_kb"
+)
+
+
+class SoakMonitor:
+    # Samples frame times, entity counts and heap usage while the autopilot plays.
+    # Frame times are the loop's own work, without the frame limiter's sleep. tracemalloc
+    # slows everything down several times over, so it is opt-in and only runs for the first
+    # half of each interval; frame times come from the untraced second half
+    def __init__(self, interval=60.0, log_path=None, trace_memory=False):
+        self.interval = interval
+        self.log_path = log_path
+        self.trace_memory = trace_memory
+        self.tracing = False
+        self.frame_times = []
+        self.frames = 0
+        self.runs = 0
+        self.best_score = 0
+        self.baseline_blocks = None
+        self.traced_memory = (0, 0)
+        self.start_time = time.perf_counter()
+        self.last_sample_time = self.start_time
+
+        if self.log_path:
+            with open(self.log_path, 'w') as f:
+                f.write(",".join(LOG_FIELDS) + "\n")
+
+    def start(self):
+        self.last_sample_time = time.perf_counter()
+        self.frame_times = []
+        self.start_tracing()
+
+    def stop(self):
+        self.stop_tracing()
+
+    def start_tracing(self):
+        # Leave tracing alone if someone else already started it
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self.tracing = True
+
+    def stop_tracing(self):
+        if self.tracing:
+            self.traced_memory = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            self.tracing = False
+
+    def record_frame(self, frame_time, game_state=None):
+        self.frames += 1
+        now = time.perf_counter()
+        if self.tracing:
+            if now - self.last_sample_time >= self.interval / 2:
+                self.stop_tracing()
+        else:
+            self.frame_times.append(frame_time)
+
+        if now - self.last_sample_time >= self.interval:
+            self.last_sample_time = now
+            self.sample(now, game_state)
+            self.start_tracing()
+
+    def record_run(self, simulation):
+        self.runs += 1
+        self.best_score = max(self.best_score, simulation.score)
+
+    def sample(self, now, game_state=None):
+        frame_ms = sorted(frame_time * 1000 for frame_time in self.frame_times)
+        self.frame_times = []
+
+        heap_blocks = sys.getallocatedblocks()
+        if self.baseline_blocks is None:
+            self.baseline_blocks = heap_blocks
+
+        text_stats = get_text_cache().get_stats()
+        traced, traced_peak = self.traced_memory
+        row = {
+            "elapsed": round(now - self.start_time, 1),
+            "frames": self.frames,
+            "frame_ms_mean": round(sum(frame_ms) / len(frame_ms), 3) if frame_ms else 0,
+            "frame_ms_p99": round(percentile(frame_ms, 99), 3),
+            "frame_ms_max": round(frame_ms[-1], 3) if frame_ms else 0,
+            "runs": self.runs,
+            "best_score": self.best_score,
+            "game_time": 0,
+            "speed": 0,
+            "obstacles": 0,
+            "clouds": 0,
+            "mountains": 0,
+            "text_hits": text_stats["hits"],
+            "text_misses": text_stats["misses"],
+            "text_cached": text_stats["size"],
+            "heap_blocks": heap_blocks,
+            "traced_kb": traced // 1024,
+            "traced_peak_kb": traced_peak // 1024
+        }
+
+        simulation = getattr(game_state, "simulation", None)
+        if simulation is not None:
+            obstacle_manager = simulation.obstacle_manager
+            row["game_time"] = obstacle_manager.game_time
+            row["speed"] = round(obstacle_manager.current_speed, 2)
+            row["obstacles"] = len(obstacle_manager.obstacles)
+            row["clouds"] = len(game_state.background.clouds)
+            row["mountains"] = len(game_state.background.mountains)
+
+        line = (
+            f"[soak {row['elapsed']:>8.0f}s] frame {row['frame_ms_mean']:.2f}ms "
+            f"(p99 {row['frame_ms_p99']:.2f}, max {row['frame_ms_max']:.2f}) "
+            f"runs {row['runs']} best {row['best_score']} "
+            f"t={row['game_time']} speed {row['speed']} "
+            f"obstacles {row['obstacles']} clouds {row['clouds']} mountains {row['mountains']} "
+            f"text {row['text_hits']}/{row['text_misses']} hit/miss "
+            f"heap {heap_blocks} blocks ({heap_blocks - self.baseline_blocks:+})"
+        )
+        if self.trace_memory:
+            line += f" traced {row['traced_kb']}KB (peak {row['traced_peak_kb']}KB)"
+        print(line)
+
+        if self.log_path:
+            with open(self.log_path, 'a') as f:
+                f.write(",".join(str(row[field]) for field in LOG_FIELDS) + "\n")
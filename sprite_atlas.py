@@ -0,0 +1,103 @@
+import pygame
+from constants import BLOCK_SIZE
+from constants import DINO, DINO_FRAMES, CACTUS_PATTERNS, SHIELD_PATTERNS
+from constants import CLOUD_PATTERNS, MOUNTAIN_PATTERNS
+
+ATLAS_PATTERNS = (
+    DINO
+    + DINO_FRAMES
+    + CACTUS_PATTERNS
+    + SHIELD_PATTERNS
+    + CLOUD_PATTERNS
+    + MOUNTAIN_PATTERNS
+)
+
+ATLAS_MAX_WIDTH = 256
+
+TRANSPARENT_INDEX = 0
+INK_INDEX = 1
+TRANSPARENT_KEY = (255, 0, 255)
+
+
+def pack_patterns(patterns, max_width=ATLAS_MAX_WIDTH, block_size=BLOCK_SIZE):
+    # Simple shelf packer: tallest patterns first, left to right, new shelf when full
+    order = sorted(range(len(patterns)), key=lambda i: len(patterns[i]), reverse=True)
+
+    rects = {}
+    shelf_x = 0
+    shelf_y = 0
+    shelf_height = 0
+    atlas_width = 0
+
+    for index in order:
+        pattern = patterns[index]
+        if id(pattern) in rects:
+            continue
+
+        width = len(pattern[0]) * block_size
+        height = len(pattern) * block_size
+
+        if shelf_x > 0 and shelf_x + width > max_width:
+            shelf_y += shelf_height
+            shelf_x = 0
+            shelf_height = 0
+
+        rects[id(pattern)] = pygame.Rect(shelf_x, shelf_y, width, height)
+        shelf_x += width
+        shelf_height = max(shelf_height, height)
+        atlas_width = max(atlas_width, shelf_x)
+
+    return rects, (atlas_width, shelf_y + shelf_height)
+
+
+def render_pattern(surface, pattern, left, top, block_size=BLOCK_SIZE):
+    # Fills the pattern's blocks with the ink index of an 8-bit palette surface
+    for y, row in enumerate(pattern):
+        for x, val in enumerate(row):
+            if val == 1:
+                rect = pygame.Rect(left + x * block_size, top + y * block_size, block_size, block_size)
+                surface.fill(INK_INDEX, rect)
+
+
+class SpriteAtlas:
+    def __init__(self, color, patterns=ATLAS_PATTERNS, block_size=BLOCK_SIZE):
+        self.block_size = block_size
+        self.patterns = patterns
+        self.rects, size = pack_patterns(patterns, block_size=block_size)
+
+        # 8-bit palette surface: index 0 is the colorkey, index 1 is the sprite color,
+        # so recoloring is a palette write instead of a re-render
+        self.surface = pygame.Surface(size, 0, 8)
+        self.surface.set_palette_at(TRANSPARENT_INDEX, TRANSPARENT_KEY)
+        self.surface.fill(TRANSPARENT_INDEX)
+        self.surface.set_colorkey(TRANSPARENT_INDEX)
+        self.set_color(color)
+
+        for pattern in patterns:
+            self.render_pattern(pattern, self.rects[id(pattern)])
+
+    def __contains__(self, pattern):
+        return id(pattern) in self.rects
+
+    def copy(self, color):
+        atlas = SpriteAtlas.__new__(SpriteAtlas)
+        atlas.block_size = self.block_size
+        atlas.patterns = self.patterns
+        atlas.rects = self.rects
+        atlas.surface = self.surface.copy()
+        atlas.surface.set_colorkey(TRANSPARENT_INDEX)
+        atlas.set_color(color)
+        return atlas
+
+    def set_color(self, color):
+        self.color = tuple(color)
+        self.surface.set_palette_at(INK_INDEX, self.color)
+
+    def render_pattern(self, pattern, area):
+        render_pattern(self.surface, pattern, area.x, area.y, self.block_size)
+
+    def get_rect(self, pattern):
+        return self.rects.get(id(pattern))
+
+    def get_memory_size(self):
+        return self.surface.get_bytesize() * self.surface.get_width() * self.surface.get_height()
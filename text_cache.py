@@ -0,0 +1,49 @@
+from collections import OrderedDict
+
+
+class TextCache:
+    def __init__(self, max_size=256):
+        self.max_size = max_size
+        self.surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, antialias, color):
+        key = (font, text, antialias, color)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_size:
+            self.surfaces.popitem(last=False)
+        return surface
+
+    def clear(self):
+        self.surfaces.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def get_stats(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self.surfaces),
+            "max_size": self.max_size
+        }
+
+
+_text_cache = TextCache()
+
+
+def get_text_cache():
+    return _text_cache
+
+
+def render_text(font, text, antialias, color):
+    # Returned surfaces are shared between callers, so blit them but never draw on them
+    return _text_cache.render(font, text, antialias, color)
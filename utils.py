@@ -1,17 +1,92 @@
 import pygame
-from constants import BLOCK_SIZE, get_color
+from constants import BLOCK_SIZE, get_color, get_color_version
+from sprite_atlas import SpriteAtlas
+
+_base_atlas = None
+_atlases = {}
+_sprite_cache = {}
+
+
+def resolve_color(color):
+    # Sprites may be drawn with a color name, which follows the active color scheme
+    if isinstance(color, str):
+        return get_color(color)
+    return color
+
+
+def get_atlas(color):
+    global _base_atlas
+    key = (color, BLOCK_SIZE)
+    version = get_color_version()
+    cached = _atlases.get(key)
+    if cached is None:
+        if _base_atlas is None:
+            _base_atlas = SpriteAtlas(resolve_color(color))
+        atlas = _base_atlas.copy(resolve_color(color))
+        _atlases[key] = (atlas, version)
+        return atlas
+
+    # Named colors follow the scheme: a scheme change is one palette write, not a re-render
+    atlas, mapped_version = cached
+    if mapped_version != version:
+        if isinstance(color, str):
+            atlas.set_color(get_color(color))
+        _atlases[key] = (atlas, version)
+    return atlas
+
+
+def render_sprite(pattern, color):
+    key = (id(pattern), color, BLOCK_SIZE)
+    version = get_color_version()
+    cached = _sprite_cache.get(key)
+    if cached is not None and cached[2] == version:
+        return cached[1]
+
+    width = len(pattern[0]) * BLOCK_SIZE
+    height = len(pattern) * BLOCK_SIZE
+    sprite = pygame.Surface((width, height), pygame.SRCALPHA)
+    color = resolve_color(color)
 
-def draw_pixel_art(win, pattern, top_left_x, top_left_y, color=None):
-    if color is None:
-        color = get_color("VERY_DARK")
-    
     for y, row in enumerate(pattern):
         for x, val in enumerate(row):
             if val == 1:
-                rect = pygame.Rect(
-                    top_left_x + x * BLOCK_SIZE,
-                    top_left_y + y * BLOCK_SIZE,
-                    BLOCK_SIZE,
-                    BLOCK_SIZE
-                )
-                pygame.draw.rect(win, color, rect)
\ No newline at end of file
+                rect = pygame.Rect(x * BLOCK_SIZE, y * BLOCK_SIZE, BLOCK_SIZE, BLOCK_SIZE)
+                sprite.fill(color, rect)
+
+    # Keep the pattern alive alongside the surface so its id() can't be reused
+    _sprite_cache[key] = (pattern, sprite, version)
+    return sprite
+
+
+def lerp(start, end, alpha):
+    return start + (end - start) * alpha
+
+
+def get_sprite(pattern, color):
+    atlas = get_atlas(color)
+    area = atlas.get_rect(pattern)
+    if area is not None:
+        return atlas.surface, area
+
+    # Patterns outside constants.py get their own surface
+    return render_sprite(pattern, color), None
+
+
+def draw_pixel_art(win, pattern, top_left_x, top_left_y, color=None):
+    if color is None:
+        color = "VERY_DARK"
+
+    surface, area = get_sprite(pattern, color)
+    win.blit(surface, (top_left_x, top_left_y), area)
+
+
+def draw_pixel_art_batch(win, sprites, color=None):
+    if color is None:
+        color = "VERY_DARK"
+
+    blits = []
+    for pattern, top_left_x, top_left_y in sprites:
+        surface, area = get_sprite(pattern, color)
+        blits.append((surface, (top_left_x, top_left_y), area))
+
+    win.blits(blits, False)
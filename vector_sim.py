@@ -0,0 +1,305 @@
+import numpy as np
+from constants import WIDTH, GROUND_Y, BLOCK_SIZE, DINO_FRAMES, CACTUS_PATTERNS
+from constants import INPUT_JUMP, INPUT_SHIELD, INPUT_DASH
+from simulation import get_score_multiplier
+from collision_masks import DINO_MASKS, DINO_FRAME_MASKS, CACTUS_MASKS
+
+# Enough slots for the densest spawn rate at the slowest obstacle speed
+MAX_OBSTACLES = 8
+
+PLAYER_WIDTH = len(DINO_FRAMES[0][0]) * BLOCK_SIZE
+PLAYER_HEIGHT = len(DINO_FRAMES[0]) * BLOCK_SIZE
+PLAYER_START_X = 100
+PLAYER_GROUND_Y = GROUND_Y - PLAYER_HEIGHT
+
+CACTUS_WIDTHS = np.array([len(pattern[0]) * BLOCK_SIZE for pattern in CACTUS_PATTERNS], dtype=np.float64)
+CACTUS_HEIGHTS = np.array([len(pattern) * BLOCK_SIZE for pattern in CACTUS_PATTERNS], dtype=np.float64)
+
+# Player poses in overlap-table order: the running frames, then the pose shown while returning from a dash
+PLAYER_MASKS = DINO_FRAME_MASKS + [DINO_MASKS[0]]
+RETURNING_POSE = len(DINO_FRAME_MASKS)
+OFFSET_X = int(CACTUS_WIDTHS.max()) - 1
+OFFSET_Y = int(CACTUS_HEIGHTS.max()) - 1
+
+_overlap_table = None
+
+
+def get_overlap_table():
+    # overlap[pose, pattern, dx + OFFSET_X, dy + OFFSET_Y] says whether Mask.overlap would find
+    # a pixel in common with the cactus top-left at (dx, dy) from the player's
+    global _overlap_table
+    if _overlap_table is None:
+        table = np.zeros(
+            (len(PLAYER_MASKS), len(CACTUS_MASKS), PLAYER_WIDTH + OFFSET_X, PLAYER_HEIGHT + OFFSET_Y),
+            dtype=bool
+        )
+        for pose, player_mask in enumerate(PLAYER_MASKS):
+            for pattern, cactus_mask in enumerate(CACTUS_MASKS):
+                # Bit (i, j) of the convolution is set when the cactus' bottom-right corner at (i, j) overlaps
+                convolution = player_mask.convolve(cactus_mask)
+                cactus_width, cactus_height = cactus_mask.get_size()
+                shift_x = OFFSET_X + 1 - cactus_width
+                shift_y = OFFSET_Y + 1 - cactus_height
+                width, height = convolution.get_size()
+                for i in range(width):
+                    for j in range(height):
+                        if convolution.get_at((i, j)):
+                            table[pose, pattern, i + shift_x, j + shift_y] = True
+        _overlap_table = table
+    return _overlap_table
+
+
+class VectorSimulation:
+    # Runs N independent games in lockstep with the same rules as Simulation.step,
+    # one NumPy array per field instead of one Python object per entity
+    def __init__(self, num_envs, upgrades, seed=None, max_obstacles=MAX_OBSTACLES):
+        self.num_envs = num_envs
+        self.max_obstacles = max_obstacles
+        self.upgrades = upgrades
+        self.score_multiplier = get_score_multiplier(upgrades)
+        self.rng = np.random.default_rng(seed)
+
+        self.base_speed = 6
+        acceleration_rate = max(0.01, 0.05 - upgrades["slow_acceleration"] * 0.01)
+        self.acceleration_rate = acceleration_rate
+        self.speed_bonus = upgrades["speed_boost"] * 0.5
+        self.slow_motion = upgrades["slow_motion"] * 0.5
+
+        self.jump_force = -15 * (1.0 + upgrades["jump_boost"] * 0.04)
+        self.gravity = 0.8
+        self.max_health = 1 + upgrades["bonus_health"]
+        self.max_shield_duration = 120 + upgrades["shield_upgrade"] * 30
+        self.max_shield_cooldown = max(600, 900 - upgrades["shield_upgrade"] * 150)
+        self.max_dash_cooldown = 300
+        self.dash_speed = 12 + upgrades["dash_distance"] * 3
+        self.dodge_chance = upgrades["dodge_chance"] * 5
+        self.overlap_table = get_overlap_table()
+
+        shape = (num_envs,)
+        self.x = np.zeros(shape)
+        self.y = np.zeros(shape)
+        self.vel_y = np.zeros(shape)
+        self.on_ground = np.zeros(shape, dtype=bool)
+        self.air_jump_used = np.zeros(shape, dtype=bool)
+        self.air_dash_used = np.zeros(shape, dtype=bool)
+        self.dash_duration = np.zeros(shape, dtype=np.int32)
+        self.dash_cooldown = np.zeros(shape, dtype=np.int32)
+        self.returning_to_start = np.zeros(shape, dtype=bool)
+        self.shield_active = np.zeros(shape, dtype=bool)
+        self.shield_duration = np.zeros(shape, dtype=np.int32)
+        self.shield_cooldown = np.zeros(shape, dtype=np.int32)
+        self.invulnerable_timer = np.zeros(shape, dtype=np.int32)
+        self.health = np.zeros(shape, dtype=np.int32)
+        self.anim_frame = np.zeros(shape, dtype=np.int32)
+        self.anim_timer = np.zeros(shape, dtype=np.int32)
+
+        self.game_time = np.zeros(shape, dtype=np.int64)
+        self.spawn_timer = np.zeros(shape, dtype=np.int32)
+        self.current_speed = np.zeros(shape)
+
+        obstacle_shape = (num_envs, max_obstacles)
+        self.obstacle_active = np.zeros(obstacle_shape, dtype=bool)
+        self.obstacle_x = np.zeros(obstacle_shape)
+        self.obstacle_y = np.zeros(obstacle_shape)
+        self.obstacle_width = np.zeros(obstacle_shape)
+        self.obstacle_height = np.zeros(obstacle_shape)
+        self.obstacle_pattern = np.zeros(obstacle_shape, dtype=np.int32)
+
+        self.tick = np.zeros(shape, dtype=np.int64)
+        self.score = np.zeros(shape, dtype=np.int64)
+        self.coins_this_run = np.zeros(shape, dtype=np.int64)
+        self.game_over = np.zeros(shape, dtype=bool)
+        self.env_indices = np.arange(num_envs)
+
+        self.reset()
+
+    def reset(self, mask=None):
+        if mask is None:
+            mask = np.ones(self.num_envs, dtype=bool)
+
+        self.x[mask] = PLAYER_START_X
+        self.y[mask] = PLAYER_GROUND_Y
+        self.vel_y[mask] = 0
+        self.on_ground[mask] = True
+        self.air_jump_used[mask] = False
+        self.air_dash_used[mask] = False
+        self.dash_duration[mask] = 0
+        self.dash_cooldown[mask] = 0
+        self.returning_to_start[mask] = False
+        self.shield_active[mask] = False
+        self.shield_duration[mask] = 0
+        self.shield_cooldown[mask] = 0
+        self.invulnerable_timer[mask] = 0
+        self.health[mask] = self.max_health
+        self.anim_frame[mask] = 0
+        self.anim_timer[mask] = 0
+
+        self.game_time[mask] = 0
+        self.spawn_timer[mask] = 0
+        self.current_speed[mask] = self.base_speed
+        self.obstacle_active[mask] = False
+
+        self.tick[mask] = 0
+        self.score[mask] = 0
+        self.coins_this_run[mask] = 0
+        self.game_over[mask] = False
+
+    def step(self, pressed=None):
+        # Runs that ended last step start over, so callers can read their final score first
+        if self.game_over.any():
+            self.reset(self.game_over)
+
+        self.update_obstacles()
+        self.update_player(pressed)
+
+        passed = self.obstacle_active & (self.obstacle_x + self.obstacle_width < 50)
+        self.obstacle_active &= ~passed
+        self.coins_this_run += passed.sum(axis=1) * (1 + self.upgrades["coin_multiplier"])
+
+        self.tick += 1
+        self.score = self.tick * self.score_multiplier
+
+        self.check_collisions()
+        return self.game_over
+
+    def update_obstacles(self):
+        self.game_time += 1
+        self.current_speed = (
+            self.base_speed + (self.game_time // 300) * self.acceleration_rate + self.speed_bonus
+        )
+
+        self.spawn_timer += 1
+        speed_factor = np.maximum(0.5, 1.0 - (self.current_speed - self.base_speed) * 0.1)
+        spawn_interval = np.clip((100 * speed_factor).astype(np.int32), 60, 120)
+        spawning = self.spawn_timer >= spawn_interval
+        self.spawn_timer[spawning] = 0
+
+        envs = self.env_indices[spawning]
+        if len(envs):
+            # First free slot in each spawning env
+            slots = np.argmin(self.obstacle_active[envs], axis=1)
+            patterns = self.rng.integers(0, len(CACTUS_PATTERNS), size=len(envs))
+            self.obstacle_active[envs, slots] = True
+            self.obstacle_x[envs, slots] = WIDTH
+            self.obstacle_width[envs, slots] = CACTUS_WIDTHS[patterns]
+            self.obstacle_height[envs, slots] = CACTUS_HEIGHTS[patterns]
+            self.obstacle_y[envs, slots] = GROUND_Y - CACTUS_HEIGHTS[patterns]
+            self.obstacle_pattern[envs, slots] = patterns
+
+        obstacle_speed = self.current_speed - self.slow_motion
+        self.obstacle_x -= obstacle_speed[:, None]
+        self.obstacle_active &= self.obstacle_x + self.obstacle_width >= 0
+
+    def update_player(self, pressed):
+        upgrades = self.upgrades
+
+        if pressed is not None:
+            jump_pressed = (pressed & INPUT_JUMP) != 0
+            shield_pressed = (pressed & INPUT_SHIELD) != 0
+            dash_pressed = (pressed & INPUT_DASH) != 0
+
+            jumping = jump_pressed & self.on_ground
+            if upgrades["air_jump"] > 0:
+                air_jumping = jump_pressed & ~self.on_ground & ~self.air_jump_used
+                self.vel_y[air_jumping] = -8
+                self.air_jump_used |= air_jumping
+
+            self.vel_y[jumping] = self.jump_force
+            self.on_ground &= ~jumping
+            self.air_jump_used &= ~jumping
+            self.air_dash_used &= ~jumping
+
+            if upgrades["shield"] > 0:
+                shielding = shield_pressed & (self.shield_cooldown == 0) & ~self.shield_active
+                self.shield_duration[shielding] = self.max_shield_duration
+                self.shield_cooldown[shielding] = self.max_shield_cooldown
+
+            if upgrades["air_dash"] > 0:
+                dashing = dash_pressed & ~self.on_ground & ~self.air_dash_used & (self.dash_cooldown == 0)
+                self.dash_duration[dashing] = 15
+                self.air_dash_used |= dashing
+                self.dash_cooldown[dashing] = self.max_dash_cooldown
+
+        self.shield_active = self.shield_duration > 0
+        self.shield_duration -= self.shield_active
+        self.shield_cooldown -= self.shield_cooldown > 0
+        self.invulnerable_timer -= self.invulnerable_timer > 0
+        self.dash_cooldown -= self.dash_cooldown > 0
+
+        dashing = self.dash_duration > 0
+        if dashing.any():
+            self.x[dashing] = np.minimum(self.x[dashing] + self.dash_speed, 750)
+            self.dash_duration -= dashing
+            self.returning_to_start |= dashing & (self.dash_duration == 0) & (self.x > PLAYER_START_X)
+
+        returning = self.returning_to_start & (self.x > PLAYER_START_X)
+        if returning.any():
+            self.x[returning] -= self.current_speed[returning]
+            arrived = returning & (self.x <= PLAYER_START_X)
+            self.x[arrived] = PLAYER_START_X
+            self.returning_to_start &= ~arrived
+
+        self.vel_y += self.gravity
+        self.y += self.vel_y
+
+        landed = self.y + PLAYER_HEIGHT >= GROUND_Y
+        self.y[landed] = PLAYER_GROUND_Y
+        self.vel_y[landed] = 0
+        self.on_ground |= landed
+        self.air_jump_used &= ~landed
+        self.air_dash_used &= ~landed
+
+        ceiling = self.y < 50
+        self.y[ceiling] = 50
+        self.vel_y[ceiling] = 0
+
+        # The animation frame picks the collision mask, so it is simulated too
+        animating = self.on_ground & ~self.returning_to_start
+        self.anim_timer += animating
+        advancing = animating & (self.anim_timer > 8)
+        self.anim_timer[advancing] = 0
+        self.anim_frame[advancing] = (self.anim_frame[advancing] + 1) % len(DINO_FRAMES)
+
+    def check_collisions(self):
+        # Same two phases as ObstacleManager.find_collision: truncated bounding rects, then masks
+        dx = (np.trunc(self.obstacle_x) - np.trunc(self.x)[:, None]).astype(np.int64)
+        dy = (self.obstacle_y - np.trunc(self.y)[:, None]).astype(np.int64)
+
+        candidates = (
+            self.obstacle_active &
+            (dx < PLAYER_WIDTH) & (dx > -self.obstacle_width) &
+            (dy < PLAYER_HEIGHT) & (dy > -self.obstacle_height)
+        )
+        candidates &= ~(self.shield_active | (self.invulnerable_timer > 0))[:, None]
+
+        candidate_envs, candidate_slots = np.nonzero(candidates)
+        if not len(candidate_envs):
+            return
+
+        pose = np.where(self.returning_to_start, RETURNING_POSE, self.anim_frame)
+        overlapping = self.overlap_table[
+            pose[candidate_envs],
+            self.obstacle_pattern[candidate_envs, candidate_slots],
+            dx[candidate_envs, candidate_slots] + OFFSET_X,
+            dy[candidate_envs, candidate_slots] + OFFSET_Y
+        ]
+        hits = np.zeros_like(candidates)
+        hits[candidate_envs[overlapping], candidate_slots[overlapping]] = True
+
+        envs = self.env_indices[hits.any(axis=1)]
+        if not len(envs):
+            return
+
+        # Obstacles all move at the same speed, so the leftmost hit is the oldest one
+        slots = np.argmin(np.where(hits[envs], self.obstacle_x[envs], np.inf), axis=1)
+        self.obstacle_active[envs, slots] = False
+
+        dashing = (self.dash_duration[envs] > 0) | self.returning_to_start[envs]
+        envs = envs[~dashing]
+        if self.dodge_chance > 0 and len(envs):
+            dodged = self.rng.integers(1, 101, size=len(envs)) <= self.dodge_chance
+            envs = envs[~dodged]
+
+        self.health[envs] -= 1
+        self.invulnerable_timer[envs] = 120
+        self.game_over[envs] = self.health[envs] <= 0